@@ -6,8 +6,10 @@ Main entry point for the application
 
 import sys
 import click
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -17,13 +19,13 @@ from src.config import (
     REPORTS_DIR,
     HISTORICAL_YEARS
 )
-from src.database import Database
+from src.database import Database, configure_rich_logging
 from src.data_collector import DataCollector
-from src.technical_analyzer import TechnicalAnalyzer, assess_currency_risk
+from src.technical_analyzer import TechnicalAnalyzer, assess_currency_risk, invalidate_analysis_cache
 from src.economic_data import EconomicDataCollector
 from src.news_collector import NewsCollector
 from src.sentiment_analyzer import SentimentAnalyzer
-from src.decision_engine import DecisionEngine, DecisionFactors
+from src.decision_engine import DecisionEngine, DecisionFactors, Recommendation, RecommendationResult
 from src.report_generator import ReportGenerator
 
 console = Console()
@@ -50,15 +52,17 @@ def initialize_database(force: bool = False):
         console.print("\n[bold]Initializing Investment Advisor Database[/bold]")
         console.print("=" * 60)
         
-        # Create schema
-        db.initialize_schema()
+        # Create tables only; secondary indexes and row counters are built once
+        # after the backfill instead of being maintained row by row during it
+        db.initialize_schema(create_indexes=False)
         
         # Download historical data
-        collector = DataCollector()
+        collector = DataCollector(use_cache=not force)
         all_data = collector.download_all_indices()
         
         if not all_data:
             console.print("[red]✗[/red] Failed to download market data")
+            db.upgrade_schema()
             return False
         
         # Store data in database
@@ -70,11 +74,13 @@ def initialize_database(force: bool = False):
                 console.print(f"[red]✗[/red] Validation failed for {index_name}: {msg}")
                 continue
             
-            db.store_historical_prices(index_name, data)
-            
-            # Update metadata
-            last_date = data.index[-1].strftime('%Y-%m-%d')
-            db.set_metadata(f'last_update_{index_name.lower()}', last_date)
+            # Prices and their last-update marker are committed together
+            with db.bulk():
+                db.store_historical_prices(index_name, data)
+                
+                # Update metadata
+                last_date = data.index[-1].strftime('%Y-%m-%d')
+                db.set_metadata(f'last_update_{index_name.lower()}', last_date)
         
         # Calculate and store currency-adjusted returns
         if 'SP500' in all_data and 'EURUSD' in all_data:
@@ -89,34 +95,44 @@ def initialize_database(force: bool = False):
         # Fetch and store M2 Money Supply data
         try:
             from src.economic_data import EconomicDataCollector
-            econ_collector = EconomicDataCollector()
-            
-            console.print("\n[bold]Fetching M2 Money Supply data...[/bold]")
-            
-            # Fetch US M2
-            m2_data_us = econ_collector.fetch_m2_data(region="US")
-            if not m2_data_us.empty:
-                db.store_economic_indicator('M2_US', m2_data_us)
-                m2_stats_us = econ_collector.calculate_m2_growth_rate(m2_data_us)
-                if m2_stats_us['yoy_growth']:
-                    console.print(f"[green]✓[/green] US M2 YoY Growth: {m2_stats_us['yoy_growth']:+.1f}%")
-            
-            # Fetch Eurozone M2
-            m2_data_ez = econ_collector.fetch_m2_data(region="EUROZONE")
-            if not m2_data_ez.empty:
-                db.store_economic_indicator('M2_EUROZONE', m2_data_ez)
-                m2_stats_ez = econ_collector.calculate_m2_growth_rate(m2_data_ez)
-                if m2_stats_ez['yoy_growth']:
-                    console.print(f"[green]✓[/green] Eurozone M2 YoY Growth: {m2_stats_ez['yoy_growth']:+.1f}%")
-            
-            if m2_data_us.empty and m2_data_ez.empty:
-                console.print("[yellow]⚠[/yellow] M2 data not available (FRED API key may be missing)")
+            with EconomicDataCollector() as econ_collector:
+                console.print("\n[bold]Fetching M2 Money Supply data...[/bold]")
+                
+                # Fetch US and Eurozone M2 concurrently
+                m2_frames = econ_collector.fetch_m2_data_all()
+                
+                # US M2
+                m2_data_us = m2_frames['US']
+                if not m2_data_us.empty:
+                    db.store_economic_indicator('M2_US', m2_data_us)
+                    m2_stats_us = econ_collector.calculate_m2_growth_rate(m2_data_us)
+                    if m2_stats_us['yoy_growth']:
+                        console.print(f"[green]✓[/green] US M2 YoY Growth: {m2_stats_us['yoy_growth']:+.1f}%")
+                
+                # Eurozone M2
+                m2_data_ez = m2_frames['EUROZONE']
+                if not m2_data_ez.empty:
+                    db.store_economic_indicator('M2_EUROZONE', m2_data_ez)
+                    m2_stats_ez = econ_collector.calculate_m2_growth_rate(m2_data_ez)
+                    if m2_stats_ez['yoy_growth']:
+                        console.print(f"[green]✓[/green] Eurozone M2 YoY Growth: {m2_stats_ez['yoy_growth']:+.1f}%")
+                
+                if m2_data_us.empty and m2_data_ez.empty:
+                    console.print("[yellow]⚠[/yellow] M2 data not available (FRED API key may be missing)")
         except Exception as e:
             console.print(f"[yellow]⚠[/yellow] Could not fetch M2 data: {str(e)}")
         
+        # Build the deferred indexes and row counters over the loaded data
+        db.upgrade_schema()
+        
         # Store initialization timestamp
-        db.set_metadata('db_initialized', datetime.now().isoformat())
-        db.set_metadata('db_version', '1.1')  # Updated version for M2 support
+        db.set_metadata_many({
+            'db_initialized': datetime.now().isoformat(),
+            'db_version': '1.1'  # Updated version for M2 support
+        })
+        
+        # Fold the bulk load back into the main file so the WAL starts small
+        db.checkpoint()
         
         console.print("\n[bold green]✓ Database initialization complete![/bold green]")
         
@@ -127,17 +143,19 @@ def initialize_database(force: bool = False):
         return True
 
 
-def update_market_data():
-    """Update market data with latest prices"""
+def update_market_data(force_refresh: bool = False):
+    """Update market data with latest prices (force_refresh bypasses the download cache)"""
     with Database() as db:
         if not db.database_exists():
             console.print("[yellow]⚠[/yellow] Database not initialized. Run with --init first.")
             return False
         
+        db.upgrade_schema()
+        
         console.print("\n[bold]🔄 Updating Market Data[/bold]")
         console.print("=" * 60)
         
-        collector = DataCollector()
+        collector = DataCollector(use_cache=not force_refresh)
         updated = False
         
         for index_name in ['SP500', 'CW8', 'STOXX600', 'EURUSD']:  # Added STOXX600
@@ -151,33 +169,32 @@ def update_market_data():
             new_data = collector.update_index_data(index_name, last_date)
             
             if new_data is not None and not new_data.empty:
-                db.store_historical_prices(index_name, new_data)
-                new_last_date = new_data.index[-1].strftime('%Y-%m-%d')
-                db.set_metadata(f'last_update_{index_name.lower()}', new_last_date)
+                with db.bulk():
+                    db.store_historical_prices(index_name, new_data)
+                    new_last_date = new_data.index[-1].strftime('%Y-%m-%d')
+                    db.set_metadata(f'last_update_{index_name.lower()}', new_last_date)
+                invalidate_analysis_cache(index_name)
                 updated = True
         
         # Update M2 data (both US and Eurozone)
         try:
             from src.economic_data import EconomicDataCollector
-            econ_collector = EconomicDataCollector()
-            
-            # Update US M2
-            m2_us_df = db.get_economic_indicator('M2_US')
-            if not m2_us_df.empty:
-                last_m2_us_date = m2_us_df.index[-1].strftime('%Y-%m-%d')
-                new_m2_us = econ_collector.update_m2_data(last_m2_us_date, region="US")
-                if new_m2_us is not None and not new_m2_us.empty:
-                    db.store_economic_indicator('M2_US', new_m2_us)
-                    updated = True
-            
-            # Update Eurozone M2
-            m2_ez_df = db.get_economic_indicator('M2_EUROZONE')
-            if not m2_ez_df.empty:
-                last_m2_ez_date = m2_ez_df.index[-1].strftime('%Y-%m-%d')
-                new_m2_ez = econ_collector.update_m2_data(last_m2_ez_date, region="EUROZONE")
-                if new_m2_ez is not None and not new_m2_ez.empty:
-                    db.store_economic_indicator('M2_EUROZONE', new_m2_ez)
-                    updated = True
+            with EconomicDataCollector() as econ_collector:
+                # Update US M2
+                last_m2_us_date = db.get_last_indicator_date('M2_US')
+                if last_m2_us_date:
+                    new_m2_us = econ_collector.update_m2_data(last_m2_us_date, region="US")
+                    if new_m2_us is not None and not new_m2_us.empty:
+                        db.store_economic_indicator('M2_US', new_m2_us)
+                        updated = True
+                
+                # Update Eurozone M2
+                last_m2_ez_date = db.get_last_indicator_date('M2_EUROZONE')
+                if last_m2_ez_date:
+                    new_m2_ez = econ_collector.update_m2_data(last_m2_ez_date, region="EUROZONE")
+                    if new_m2_ez is not None and not new_m2_ez.empty:
+                        db.store_economic_indicator('M2_EUROZONE', new_m2_ez)
+                        updated = True
         except Exception as e:
             console.print(f"[dim]M2 update skipped: {str(e)}[/dim]")
         
@@ -238,6 +255,103 @@ def print_database_stats(stats: dict):
             console.print(f"Latest YoY Growth: [{color}]{growth:+.1f}%[/{color}]")
 
 
+def summarize_analysis(tech_analysis: dict, sentiment: dict) -> dict:
+    """Flatten a technical analysis + sentiment aggregate into report fields"""
+    dip = tech_analysis.get('dip', {})
+    momentum = tech_analysis.get('momentum', {})
+    trend = tech_analysis.get('trend', {})
+    
+    return {
+        'current_price': dip.get('current_price', 0),
+        'dip_pct': dip.get('dip_percentage', 0),
+        'rsi': momentum.get('rsi', 0),
+        'trend': trend.get('trend', 'unknown'),
+        'sentiment': sentiment.get('sentiment_score', 0)
+    }
+
+
+def summarize_recommendation(result: Optional[RecommendationResult]) -> dict:
+    """Flatten a decision engine result into report fields"""
+    if not result:
+        return {'recommendation': 'HOLD', 'confidence': 0, 'score': 0, 'reasons': [], 'risk_factors': []}
+    
+    return {
+        'recommendation': result.recommendation.name,
+        'confidence': result.confidence,
+        'score': result.score,
+        'reasons': result.reasons,
+        'risk_factors': result.risk_factors
+    }
+
+
+def export_reports(report_generator: ReportGenerator, report_data: dict, export_format: str):
+    """Export report data in the requested format(s)"""
+    console.print("\n[bold cyan]📁 Exporting Reports[/bold cyan]")
+    console.print("=" * 60)
+    
+    exported_files = []
+    
+    if export_format in ['txt', 'all']:
+        filepath = report_generator.export_to_txt(report_data)
+        console.print(f"[green]✓[/green] TXT report: {filepath}")
+        exported_files.append(filepath)
+    
+    if export_format in ['json', 'all']:
+        filepath = report_generator.export_to_json(report_data)
+        console.print(f"[green]✓[/green] JSON report: {filepath}")
+        exported_files.append(filepath)
+    
+    if export_format in ['csv', 'all']:
+        filepath = report_generator.export_to_csv(report_data)
+        console.print(f"[green]✓[/green] CSV report: {filepath}")
+        exported_files.append(filepath)
+    
+    console.print(f"\n[bold green]✓ Exported {len(exported_files)} report(s)[/bold green]")
+
+
+def print_cached_summary(report_generator: ReportGenerator, report_data: dict):
+    """Print the summary tables from a cached report"""
+    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
+    console.print("[bold cyan]📋 EXECUTIVE SUMMARY[/bold cyan]")
+    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
+    
+    console.print(report_generator.create_summary_table(
+        sp500_data=report_data['sp500'],
+        cw8_data=report_data['cw8'],
+        currency_data=report_data['currency'],
+        m2_data=report_data['m2'],
+        stoxx600_data=report_data.get('stoxx600')
+    ))
+    console.print()
+    
+    # Recommendation enums were serialized by name
+    recs = {
+        key: RecommendationResult(**{
+            **rec,
+            'recommendation': Recommendation[rec['recommendation']],
+            'risk_tolerance': report_data['risk_tolerance']
+        })
+        for key, rec in report_data['recommendations'].items()
+    }
+    if report_data.get('comparison') and 'sp500' in recs and 'cw8' in recs:
+        console.print(report_generator.create_recommendation_table(
+            recs['sp500'], recs['cw8'], report_data['comparison'], recs.get('stoxx600')
+        ))
+        console.print()
+    
+    risks = report_data['risks']
+    console.print(report_generator.create_risk_assessment_table(
+        risks['recession_prob'],
+        risks['recession_level'],
+        risks['ai_bubble_risk'],
+        risks['ai_bubble_level'],
+        risks['market_tone'],
+        risks['bullish_ratio'],
+        risks['bearish_ratio']
+    ))
+    console.print()
+
+
 @click.command()
 @click.option('--init', is_flag=True, help='Initialize database with historical data')
 @click.option('--force-init', is_flag=True, help='Force reinitialize database')
@@ -250,11 +364,15 @@ def print_database_stats(stats: dict):
 @click.option('--force-update', is_flag=True, help='Force full data refresh')
 @click.option('--export-db', is_flag=True, help='Export database to CSV files')
 @click.option('--export-report', type=click.Choice(['txt', 'json', 'csv', 'all']),
-              help='Export report to file format(s)')
-@click.option('--summary', is_flag=True, help='Show compact summary view with tables')
-def main(init, force_init, stats, risk, index, verbose, force_update, export_db, export_report, summary):
+              help='Export report to file format(s); reruns with unchanged inputs reuse the cached report')
+@click.option('--summary', is_flag=True,
+              help='Show compact summary view with tables; a cached report (unchanged prices, M2 and news) '
+                   'prints only this summary')
+@click.option('--plain', is_flag=True, help='Render summary tables as plain aligned text')
+def main(init, force_init, stats, risk, index, verbose, force_update, export_db, export_report, summary, plain):
     """Investment Advisory CLI - Should I invest now?"""
     
+    configure_rich_logging(console)
     print_banner()
     
     # Handle initialization
@@ -288,7 +406,7 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
         sys.exit(0)
     
     # Main analysis workflow
-    with Database() as db:
+    with Database() as db, NewsCollector() as news_collector:
         if not db.database_exists():
             console.print("[yellow]⚠[/yellow]  Database not initialized.")
             console.print("\nFirst time setup required:")
@@ -297,20 +415,59 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             sys.exit(1)
         
         # Update market data
-        update_market_data()
+        update_market_data(force_refresh=force_update)
+        
+        report_generator = ReportGenerator(str(REPORTS_DIR), simple=plain)
+        
+        news_by_category = None
+        
+        # Reports for unchanged inputs (same day, same stored data, same news) are
+        # served from cache. News is collected first so it is part of the key; a
+        # hit therefore means these articles were stored by the run that cached it.
+        report_cache_path = None
+        if (summary or export_report) and index == 'all':
+            news_by_category = news_collector.collect_market_news()
+            indicators = db.get_latest_indicators_snapshot()
+            report_cache_path = report_generator.get_cache_path({
+                'date': datetime.now().strftime('%Y-%m-%d'),
+                'risk': risk,
+                'prices': {idx: db.get_last_update_date(idx) for idx in ['SP500', 'CW8', 'STOXX600', 'EURUSD']},
+                'm2': {name: indicators.get(name, {}).get('date') for name in ['M2_US', 'M2_EUROZONE']},
+                'news': sorted(article.url or article.title
+                               for article in news_collector.get_all_articles(news_by_category))
+            })
+            cached_report = None if force_update else report_generator.load_cached_report(report_cache_path)
+            
+            if cached_report:
+                console.print(f"\n[dim]Inputs unchanged since {cached_report['timestamp']} - "
+                              f"using cached analysis (--force-update to recompute)[/dim]")
+                if summary:
+                    print_cached_summary(report_generator, cached_report)
+                if export_report:
+                    export_reports(report_generator, cached_report, export_report)
+                return
         
         # Perform technical analysis
         console.print("\n[bold]📊 Performing Technical Analysis[/bold]")
         console.print("=" * 60)
         
         analyzer = TechnicalAnalyzer()
-        econ_collector = EconomicDataCollector()
+        
+        # Indices selected via --index, in display order
+        selected_indices = [idx for idx in ['SP500', 'CW8', 'STOXX600'] if index == 'all' or index.upper() == idx]
+        
+        # Load prices on this thread (the SQLite connection is not shareable),
+        # then run the independent per-index analyses concurrently
+        price_frames = {idx: db.get_historical_prices(idx) for idx in selected_indices}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                idx: executor.submit(analyzer.calculate_comprehensive_analysis, df, idx)
+                for idx, df in price_frames.items() if not df.empty
+            }
+            index_analyses = {idx: future.result() for idx, future in futures.items()}
         
         # Analyze each index
-        for idx in ['SP500', 'CW8', 'STOXX600']:  # Added STOXX600
-            if index != 'all' and index.upper() != idx:  # Changed 'both' to 'all'
-                continue
-            
+        for idx in selected_indices:
             # Emoji selection
             if idx == 'SP500':
                 emoji = '📈'
@@ -323,13 +480,13 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             console.print("─" * 60)
             
             # Get data
-            df = db.get_historical_prices(idx)
+            df = price_frames[idx]
             if df.empty:
                 console.print(f"[red]✗[/red] No data available for {idx}")
                 continue
             
             # Comprehensive technical analysis
-            analysis = analyzer.calculate_comprehensive_analysis(df)
+            analysis = index_analyses[idx]
             
             # Current price and basic info (currency-aware)
             current = analysis['dip']['current_price']
@@ -376,8 +533,9 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
         console.print(f"\n[bold cyan]💱 EUR/USD Currency Analysis[/bold cyan]")
         console.print("─" * 60)
         eurusd_df = db.get_historical_prices('EURUSD')
-        if not eurusd_df.empty:
-            curr_analysis = analyzer.calculate_comprehensive_analysis(eurusd_df)
+        have_fx = not eurusd_df.empty
+        if have_fx:
+            curr_analysis = analyzer.calculate_comprehensive_analysis(eurusd_df, 'EURUSD')
             curr_risk = assess_currency_risk(eurusd_df)
             
             current_rate = curr_analysis['dip']['current_price']
@@ -397,57 +555,60 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
         console.print(f"\n[bold cyan]💵 M2 Money Supply Analysis[/bold cyan]")
         console.print("─" * 60)
         
-        # US M2
-        console.print(f"\n[bold]🇺🇸 US M2 (for S&P 500, MSCI World)[/bold]")
-        m2_us_df = db.get_economic_indicator('M2_US')
-        if not m2_us_df.empty:
-            m2_us_stats = econ_collector.calculate_m2_growth_rate(m2_us_df)
-            m2_us_assessment = econ_collector.assess_m2_favorability(m2_us_stats['yoy_growth'])
-            
-            if m2_us_stats['current_value'] is not None:
-                console.print(f"Latest M2: ${m2_us_stats['current_value']:.0f}B")
-            if m2_us_stats['yoy_growth'] is not None:
-                console.print(f"YoY Growth: [bold]{m2_us_stats['yoy_growth']:+.2f}%[/bold]")
-            if m2_us_stats['mom_growth'] is not None:
-                console.print(f"MoM Growth: {m2_us_stats['mom_growth']:+.2f}%")
-            
-            impact_color = "green" if m2_us_assessment['is_favorable'] else "red" if m2_us_assessment['is_favorable'] == False else "yellow"
-            console.print(f"Liquidity: [{impact_color}]{m2_us_assessment['impact'].upper()}[/{impact_color}] (Score: {m2_us_assessment['score']:+d})")
-            console.print(f"{m2_us_assessment['message']}")
-        else:
-            console.print("[yellow]No US M2 data available[/yellow]")
-        
-        # Eurozone M2
-        console.print(f"\n[bold]🇪🇺 Eurozone M2 (for STOXX 600)[/bold]")
-        m2_ez_df = db.get_economic_indicator('M2_EUROZONE')
-        if not m2_ez_df.empty:
-            m2_ez_stats = econ_collector.calculate_m2_growth_rate(m2_ez_df)
-            m2_ez_assessment = econ_collector.assess_m2_favorability(m2_ez_stats['yoy_growth'])
-            
-            if m2_ez_stats['current_value'] is not None:
-                console.print(f"Latest M2: €{m2_ez_stats['current_value']:.0f}M")
-            if m2_ez_stats['yoy_growth'] is not None:
-                console.print(f"YoY Growth: [bold]{m2_ez_stats['yoy_growth']:+.2f}%[/bold]")
-            if m2_ez_stats['mom_growth'] is not None:
-                console.print(f"MoM Growth: {m2_ez_stats['mom_growth']:+.2f}%")
-            
-            impact_color = "green" if m2_ez_assessment['is_favorable'] else "red" if m2_ez_assessment['is_favorable'] == False else "yellow"
-            console.print(f"Liquidity: [{impact_color}]{m2_ez_assessment['impact'].upper()}[/{impact_color}] (Score: {m2_ez_assessment['score']:+d})")
-            console.print(f"{m2_ez_assessment['message']}")
-        else:
-            console.print("[yellow]No Eurozone M2 data available[/yellow]")
-            console.print("[yellow]⚠[/yellow] M2 data not available (FRED API key required)")
-            console.print("Set FRED_API_KEY in .env to enable M2 analysis")
+        with EconomicDataCollector() as econ_collector:
+            # US M2
+            console.print(f"\n[bold]🇺🇸 US M2 (for S&P 500, MSCI World)[/bold]")
+            m2_us_df = db.get_economic_indicator('M2_US')
+            have_us_m2 = not m2_us_df.empty
+            if have_us_m2:
+                m2_us_stats = econ_collector.calculate_m2_growth_rate(m2_us_df)
+                m2_us_assessment = econ_collector.assess_m2_favorability(m2_us_stats['yoy_growth'])
+                
+                if m2_us_stats['current_value'] is not None:
+                    console.print(f"Latest M2: ${m2_us_stats['current_value']:.0f}B")
+                if m2_us_stats['yoy_growth'] is not None:
+                    console.print(f"YoY Growth: [bold]{m2_us_stats['yoy_growth']:+.2f}%[/bold]")
+                if m2_us_stats['mom_growth'] is not None:
+                    console.print(f"MoM Growth: {m2_us_stats['mom_growth']:+.2f}%")
+                
+                impact_color = "green" if m2_us_assessment['is_favorable'] else "red" if m2_us_assessment['is_favorable'] == False else "yellow"
+                console.print(f"Liquidity: [{impact_color}]{m2_us_assessment['impact'].upper()}[/{impact_color}] (Score: {m2_us_assessment['score']:+d})")
+                console.print(f"{m2_us_assessment['message']}")
+            else:
+                console.print("[yellow]No US M2 data available[/yellow]")
+            
+            # Eurozone M2
+            console.print(f"\n[bold]🇪🇺 Eurozone M2 (for STOXX 600)[/bold]")
+            m2_ez_df = db.get_economic_indicator('M2_EUROZONE')
+            have_ez_m2 = not m2_ez_df.empty
+            if have_ez_m2:
+                m2_ez_stats = econ_collector.calculate_m2_growth_rate(m2_ez_df)
+                m2_ez_assessment = econ_collector.assess_m2_favorability(m2_ez_stats['yoy_growth'])
+                
+                if m2_ez_stats['current_value'] is not None:
+                    console.print(f"Latest M2: €{m2_ez_stats['current_value']:.0f}M")
+                if m2_ez_stats['yoy_growth'] is not None:
+                    console.print(f"YoY Growth: [bold]{m2_ez_stats['yoy_growth']:+.2f}%[/bold]")
+                if m2_ez_stats['mom_growth'] is not None:
+                    console.print(f"MoM Growth: {m2_ez_stats['mom_growth']:+.2f}%")
+                
+                impact_color = "green" if m2_ez_assessment['is_favorable'] else "red" if m2_ez_assessment['is_favorable'] == False else "yellow"
+                console.print(f"Liquidity: [{impact_color}]{m2_ez_assessment['impact'].upper()}[/{impact_color}] (Score: {m2_ez_assessment['score']:+d})")
+                console.print(f"{m2_ez_assessment['message']}")
+            else:
+                console.print("[yellow]No Eurozone M2 data available[/yellow]")
+                console.print("[yellow]⚠[/yellow] M2 data not available (FRED API key required)")
+                console.print("Set FRED_API_KEY in .env to enable M2 analysis")
         
         # News & Sentiment Analysis
         console.print(f"\n[bold cyan]📰 News & Sentiment Analysis[/bold cyan]")
         console.print("=" * 60)
         
-        news_collector = NewsCollector()
         sentiment_analyzer = SentimentAnalyzer()
         
-        # Collect news
-        news_by_category = news_collector.collect_market_news()
+        # Collect news (already done above when the report cache was checked)
+        if news_by_category is None:
+            news_by_category = news_collector.collect_market_news()
         
         # Analyze sentiment for each category
         console.print("\n[bold]Analyzing Sentiment by Category:[/bold]")
@@ -526,9 +687,10 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
         
         # Store news in database
         console.print(f"\n[dim]Storing {len(analyzed_all)} articles in database...[/dim]")
+        articles_to_store = []
         for article in analyzed_all:
             # Determine related index
-            category = article.get('category', 'market_general')
+            category = article.category or 'market_general'
             if 'sp500' in category:
                 related_index = 'SP500'
             elif 'cw8' in category:
@@ -540,16 +702,19 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             else:
                 related_index = 'GENERAL'
             
-            db.store_news_article(
-                title=article.get('title', ''),
-                description=article.get('description', ''),
-                source=article.get('source', ''),
-                published_at=article.get('published_at'),
-                url=article.get('url', ''),
-                sentiment_score=article.get('sentiment_score', 0),
-                sentiment_label=article.get('sentiment_label', 'neutral'),
-                related_index=related_index
-            )
+            articles_to_store.append({
+                'title': article.title,
+                'description': article.description,
+                'source': article.source,
+                'published_at': article.published_at,
+                'url': article.url,
+                'sentiment_score': article.sentiment_score,
+                'sentiment_label': article.sentiment_label,
+                'related_index': related_index
+            })
+        
+        # Store all articles in a single transaction
+        db.store_news_articles(articles_to_store)
         
         console.print(f"[green]✓[/green] News analysis complete")
         
@@ -566,10 +731,7 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
         recommendations = {}
         tech_analyses = {}  # Store for later use in reports
         
-        for idx in ['SP500', 'CW8', 'STOXX600']:  # Added STOXX600
-            if index != 'all' and index.upper() != idx:  # Changed 'both' to 'all'
-                continue
-            
+        for idx in selected_indices:
             # Emoji selection
             if idx == 'SP500':
                 emoji = '📈'
@@ -587,7 +749,7 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
                 console.print(f"[red]✗[/red] No data for {idx}")
                 continue
             
-            tech_analysis = analyzer.calculate_comprehensive_analysis(df)
+            tech_analysis = analyzer.calculate_comprehensive_analysis(df, idx)
             tech_analyses[idx] = tech_analysis  # Store for reports
             
             # Get sentiment for this index
@@ -603,8 +765,7 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             currency_change = None
             currency_impact = None
             
-            if idx == 'SP500' and not eurusd_df.empty:
-                curr_risk = assess_currency_risk(eurusd_df)
+            if idx == 'SP500' and have_fx:
                 currency_risk = curr_risk['risk_level']
                 currency_change = curr_risk['change_pct']
                 currency_impact = curr_risk['impact']
@@ -612,14 +773,14 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             # Select appropriate M2 data based on index
             if idx == 'STOXX600':
                 # Use Eurozone M2 for STOXX 600
-                m2_df_regional = m2_ez_df
-                m2_stats_regional = m2_ez_stats if not m2_ez_df.empty else {}
-                m2_assessment_regional = m2_ez_assessment if not m2_ez_df.empty else {}
+                have_m2 = have_ez_m2
+                m2_stats_regional = m2_ez_stats if have_m2 else {}
+                m2_assessment_regional = m2_ez_assessment if have_m2 else {}
             else:
                 # Use US M2 for S&P 500 and MSCI World
-                m2_df_regional = m2_us_df
-                m2_stats_regional = m2_us_stats if not m2_us_df.empty else {}
-                m2_assessment_regional = m2_us_assessment if not m2_us_df.empty else {}
+                have_m2 = have_us_m2
+                m2_stats_regional = m2_us_stats if have_m2 else {}
+                m2_assessment_regional = m2_us_assessment if have_m2 else {}
             
             # Create DecisionFactors
             factors = DecisionFactors(
@@ -648,9 +809,9 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
                 ai_bubble_level=bubble_result['level'],
                 
                 # M2 Money Supply (KEY FACTOR!) - Region-specific
-                m2_yoy_growth=m2_stats_regional.get('yoy_growth') if not m2_df_regional.empty else None,
-                m2_score=m2_assessment_regional.get('score', 0) if not m2_df_regional.empty else 0,
-                m2_favorability=m2_assessment_regional.get('impact', 'unknown') if not m2_df_regional.empty else 'unknown',
+                m2_yoy_growth=m2_stats_regional.get('yoy_growth') if have_m2 else None,
+                m2_score=m2_assessment_regional.get('score', 0) if have_m2 else 0,
+                m2_favorability=m2_assessment_regional.get('impact', 'unknown') if have_m2 else 'unknown',
                 
                 # Currency factors
                 currency_risk_level=currency_risk,
@@ -663,9 +824,9 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             recommendations[idx] = result
             
             # Display recommendation
-            rec = result['recommendation'].value
-            confidence = result['confidence']
-            score = result['score']
+            rec = result.recommendation.name
+            confidence = result.confidence
+            score = result.score
             
             # Color coding
             if rec == 'STRONG_BUY':
@@ -686,15 +847,15 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             console.print(f"Decision Score: {score:+d}/100")
             
             # Show reasons
-            if result['reasons']:
+            if result.reasons:
                 console.print(f"\n[bold green]✓ Positive Factors:[/bold green]")
-                for reason in result['reasons']:
+                for reason in result.reasons:
                     console.print(f"  • {reason}")
             
             # Show risk factors
-            if result['risk_factors']:
+            if result.risk_factors:
                 console.print(f"\n[bold red]⚠ Risk Factors:[/bold red]")
-                for risk in result['risk_factors']:
+                for risk in result.risk_factors:
                     console.print(f"  • {risk}")
             
             console.print()
@@ -760,146 +921,81 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
         # PHASE 5: ENHANCED REPORTING & EXPORT 📊
         # ============================================================
         
-        # Prepare report data
-        report_generator = ReportGenerator(str(REPORTS_DIR))
-        
-        # Get stored analyses safely
-        tech_analysis_sp500 = tech_analyses.get('SP500', {})
-        tech_analysis_cw8 = tech_analyses.get('CW8', {})
-        sp500_sentiment = sentiment_results.get('sp500', {}).get('aggregate', overall_sentiment)
-        cw8_sentiment = sentiment_results.get('cw8', {}).get('aggregate', overall_sentiment)
-        
-        report_data = {
-            'timestamp': datetime.now().isoformat(),
-            'risk_tolerance': risk,
-            'sp500': {
-                'current_price': tech_analysis_sp500.get('dip', {}).get('current_price', 0),
-                'dip_pct': tech_analysis_sp500.get('dip', {}).get('dip_percentage', 0),
-                'rsi': tech_analysis_sp500.get('momentum', {}).get('rsi', 0),
-                'trend': tech_analysis_sp500.get('trend', {}).get('trend', 'unknown'),
-                'sentiment': sp500_sentiment.get('sentiment_score', 0)
-            },
-            'cw8': {
-                'current_price': tech_analysis_cw8.get('dip', {}).get('current_price', 0),
-                'dip_pct': tech_analysis_cw8.get('dip', {}).get('dip_percentage', 0),
-                'rsi': tech_analysis_cw8.get('momentum', {}).get('rsi', 0),
-                'trend': tech_analysis_cw8.get('trend', {}).get('trend', 'unknown'),
-                'sentiment': cw8_sentiment.get('sentiment_score', 0)
-            },
-            'currency': {
-                'current_rate': curr_analysis['dip']['current_price'] if not eurusd_df.empty else 0,
-                'change_pct': curr_risk['change_pct'] if not eurusd_df.empty else 0,
-                'impact': curr_risk['impact'] if not eurusd_df.empty else 'unknown'
-            },
-            'm2': {
-                'us_yoy_growth': m2_us_stats.get('yoy_growth') if not m2_us_df.empty else None,
-                'us_favorability': m2_us_assessment.get('impact', 'unknown') if not m2_us_df.empty else 'unknown',
-                'eurozone_yoy_growth': m2_ez_stats.get('yoy_growth') if not m2_ez_df.empty else None,
-                'eurozone_favorability': m2_ez_assessment.get('impact', 'unknown') if not m2_ez_df.empty else 'unknown',
-                # Backward compatibility
-                'yoy_growth': m2_us_stats.get('yoy_growth') if not m2_us_df.empty else None,
-                'favorability': m2_us_assessment.get('impact', 'unknown') if not m2_us_df.empty else 'unknown'
-            },
-            'recommendations': {
-                'sp500': {
-                    'recommendation': recommendations.get('SP500', {}).get('recommendation', 'HOLD').value if hasattr(recommendations.get('SP500', {}).get('recommendation'), 'value') else 'HOLD',
-                    'confidence': recommendations.get('SP500', {}).get('confidence', 0),
-                    'score': recommendations.get('SP500', {}).get('score', 0),
-                    'reasons': recommendations.get('SP500', {}).get('reasons', []),
-                    'risk_factors': recommendations.get('SP500', {}).get('risk_factors', [])
+        # Report data and summary tables are only needed for --summary/--export-report
+        if summary or export_report:
+            # Prepare report data
+            # Get stored analyses safely
+            tech_analysis_sp500 = tech_analyses.get('SP500', {})
+            tech_analysis_cw8 = tech_analyses.get('CW8', {})
+            sp500_sentiment = sentiment_results.get('sp500', {}).get('aggregate', overall_sentiment)
+            cw8_sentiment = sentiment_results.get('cw8', {}).get('aggregate', overall_sentiment)
+            
+            report_data = {
+                'timestamp': datetime.now().isoformat(),
+                'risk_tolerance': risk,
+                'sp500': summarize_analysis(tech_analysis_sp500, sp500_sentiment),
+                'cw8': summarize_analysis(tech_analysis_cw8, cw8_sentiment),
+                'currency': {
+                    'current_rate': curr_analysis['dip']['current_price'] if have_fx else 0,
+                    'change_pct': curr_risk['change_pct'] if have_fx else 0,
+                    'impact': curr_risk['impact'] if have_fx else 'unknown'
+                },
+                'm2': {
+                    'us_yoy_growth': m2_us_stats.get('yoy_growth') if have_us_m2 else None,
+                    'us_favorability': m2_us_assessment.get('impact', 'unknown') if have_us_m2 else 'unknown',
+                    'eurozone_yoy_growth': m2_ez_stats.get('yoy_growth') if have_ez_m2 else None,
+                    'eurozone_favorability': m2_ez_assessment.get('impact', 'unknown') if have_ez_m2 else 'unknown',
+                    # Backward compatibility
+                    'yoy_growth': m2_us_stats.get('yoy_growth') if have_us_m2 else None,
+                    'favorability': m2_us_assessment.get('impact', 'unknown') if have_us_m2 else 'unknown'
+                },
+                'recommendations': {
+                    'sp500': summarize_recommendation(recommendations.get('SP500')),
+                    'cw8': summarize_recommendation(recommendations.get('CW8'))
                 },
-                'cw8': {
-                    'recommendation': recommendations.get('CW8', {}).get('recommendation', 'HOLD').value if hasattr(recommendations.get('CW8', {}).get('recommendation'), 'value') else 'HOLD',
-                    'confidence': recommendations.get('CW8', {}).get('confidence', 0),
-                    'score': recommendations.get('CW8', {}).get('score', 0),
-                    'reasons': recommendations.get('CW8', {}).get('reasons', []),
-                    'risk_factors': recommendations.get('CW8', {}).get('risk_factors', [])
+                'comparison': comparison,
+                'risks': {
+                    'recession_prob': recession_result['probability'],
+                    'recession_level': recession_result['level'],
+                    'ai_bubble_risk': bubble_result['risk'],
+                    'ai_bubble_level': bubble_result['level'],
+                    'market_tone': market_analysis['market_sentiment'],
+                    'bullish_ratio': market_analysis['bullish_ratio'],
+                    'bearish_ratio': market_analysis['bearish_ratio']
                 }
-            },
-            'comparison': comparison,
-            'risks': {
-                'recession_prob': recession_result['probability'],
-                'recession_level': recession_result['level'],
-                'ai_bubble_risk': bubble_result['risk'],
-                'ai_bubble_level': bubble_result['level'],
-                'market_tone': market_analysis['market_sentiment'],
-                'bullish_ratio': market_analysis['bullish_ratio'],
-                'bearish_ratio': market_analysis['bearish_ratio']
-            }
-        }
-        
-        # Get STOXX600 analysis if available (needed for both report_data and summary tables)
-        stoxx600_df = db.get_historical_prices('STOXX600')
-        tech_analysis_stoxx600 = analyzer.calculate_comprehensive_analysis(stoxx600_df) if not stoxx600_df.empty else None
-        stoxx600_sentiment = sentiment_results.get('stoxx600', {}).get('aggregate', overall_sentiment) if tech_analysis_stoxx600 else None
-        
-        # Add STOXX600 data to report if available
-        if tech_analysis_stoxx600 and stoxx600_sentiment:
-            report_data['stoxx600'] = {
-                'current_price': tech_analysis_stoxx600.get('dip', {}).get('current_price', 0),
-                'dip_pct': tech_analysis_stoxx600.get('dip', {}).get('dip_percentage', 0),
-                'rsi': tech_analysis_stoxx600.get('momentum', {}).get('rsi', 0),
-                'trend': tech_analysis_stoxx600.get('trend', {}).get('trend', 'unknown'),
-                'sentiment': stoxx600_sentiment.get('sentiment_score', 0)
             }
-            if recommendations.get('STOXX600'):
-                report_data['recommendations']['stoxx600'] = {
-                    'recommendation': recommendations.get('STOXX600', {}).get('recommendation', 'HOLD').value if hasattr(recommendations.get('STOXX600', {}).get('recommendation'), 'value') else 'HOLD',
-                    'confidence': recommendations.get('STOXX600', {}).get('confidence', 0),
-                    'score': recommendations.get('STOXX600', {}).get('score', 0),
-                    'reasons': recommendations.get('STOXX600', {}).get('reasons', []),
-                    'risk_factors': recommendations.get('STOXX600', {}).get('risk_factors', [])
-                }
-        
-        # Store references for summary tables (recalculate SP500 and CW8 for fresh data)
-        tech_analysis_sp500 = analyzer.calculate_comprehensive_analysis(db.get_historical_prices('SP500'))
-        tech_analysis_cw8 = analyzer.calculate_comprehensive_analysis(db.get_historical_prices('CW8'))
-        sp500_sentiment = sentiment_results.get('sp500', {}).get('aggregate', overall_sentiment)
-        cw8_sentiment = sentiment_results.get('cw8', {}).get('aggregate', overall_sentiment)
-        
-        # Show summary tables if requested
-        if summary or export_report:
+            
+            # Get STOXX600 analysis if available (needed for both report_data and summary tables)
+            tech_analysis_stoxx600 = tech_analyses.get('STOXX600')
+            if not tech_analysis_stoxx600:
+                stoxx600_df = db.get_historical_prices('STOXX600')
+                tech_analysis_stoxx600 = analyzer.calculate_comprehensive_analysis(stoxx600_df, 'STOXX600') if not stoxx600_df.empty else None
+            stoxx600_sentiment = sentiment_results.get('stoxx600', {}).get('aggregate', overall_sentiment) if tech_analysis_stoxx600 else None
+            
+            # Add STOXX600 data to report if available
+            if tech_analysis_stoxx600 and stoxx600_sentiment:
+                report_data['stoxx600'] = summarize_analysis(tech_analysis_stoxx600, stoxx600_sentiment)
+                if recommendations.get('STOXX600'):
+                    report_data['recommendations']['stoxx600'] = summarize_recommendation(recommendations['STOXX600'])
+            
+            # Show summary tables
+            # Reuse the Phase 4 analyses; only indices skipped via --index need computing
+            if not tech_analysis_sp500:
+                tech_analysis_sp500 = analyzer.calculate_comprehensive_analysis(db.get_historical_prices('SP500'), 'SP500')
+            if not tech_analysis_cw8:
+                tech_analysis_cw8 = analyzer.calculate_comprehensive_analysis(db.get_historical_prices('CW8'), 'CW8')
+            
             console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
             console.print("[bold cyan]� EXECUTIVE SUMMARY[/bold cyan]")
             console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
             
             # Market Summary Table
             summary_table = report_generator.create_summary_table(
-                sp500_data={
-                    'current_price': tech_analysis_sp500['dip']['current_price'],
-                    'dip_pct': tech_analysis_sp500['dip']['dip_percentage'],
-                    'rsi': tech_analysis_sp500['momentum']['rsi'],
-                    'trend': tech_analysis_sp500['trend']['trend'],
-                    'sentiment': sp500_sentiment.get('sentiment_score', 0)
-                },
-                cw8_data={
-                    'current_price': tech_analysis_cw8['dip']['current_price'],
-                    'dip_pct': tech_analysis_cw8['dip']['dip_percentage'],
-                    'rsi': tech_analysis_cw8['momentum']['rsi'],
-                    'trend': tech_analysis_cw8['trend']['trend'],
-                    'sentiment': cw8_sentiment.get('sentiment_score', 0)
-                },
-                currency_data={
-                    'current_rate': curr_analysis['dip']['current_price'] if not eurusd_df.empty else 0,
-                    'change_pct': curr_risk['change_pct'] if not eurusd_df.empty else 0,
-                    'impact': curr_risk['impact'] if not eurusd_df.empty else 'unknown'
-                },
-                m2_data={
-                    'us_yoy_growth': m2_us_stats.get('yoy_growth') if not m2_us_df.empty else None,
-                    'us_favorability': m2_us_assessment.get('impact', 'unknown') if not m2_us_df.empty else 'unknown',
-                    'eurozone_yoy_growth': m2_ez_stats.get('yoy_growth') if not m2_ez_df.empty else None,
-                    'eurozone_favorability': m2_ez_assessment.get('impact', 'unknown') if not m2_ez_df.empty else 'unknown',
-                    # Backward compatibility
-                    'yoy_growth': m2_us_stats.get('yoy_growth') if not m2_us_df.empty else None,
-                    'favorability': m2_us_assessment.get('impact', 'unknown') if not m2_us_df.empty else 'unknown'
-                },
-                stoxx600_data={
-                    'current_price': tech_analysis_stoxx600['dip']['current_price'],
-                    'dip_pct': tech_analysis_stoxx600['dip']['dip_percentage'],
-                    'rsi': tech_analysis_stoxx600['momentum']['rsi'],
-                    'trend': tech_analysis_stoxx600['trend']['trend'],
-                    'sentiment': stoxx600_sentiment.get('sentiment_score', 0)
-                } if tech_analysis_stoxx600 and stoxx600_sentiment else None
+                sp500_data=summarize_analysis(tech_analysis_sp500, sp500_sentiment),
+                cw8_data=summarize_analysis(tech_analysis_cw8, cw8_sentiment),
+                currency_data=report_data['currency'],
+                m2_data=report_data['m2'],
+                stoxx600_data=report_data.get('stoxx600')
             )
             console.print(summary_table)
             console.print()
@@ -927,30 +1023,13 @@ def main(init, force_init, stats, risk, index, verbose, force_update, export_db,
             )
             console.print(risk_table)
             console.print()
-        
-        # Export reports if requested
-        if export_report:
-            console.print("\n[bold cyan]📁 Exporting Reports[/bold cyan]")
-            console.print("=" * 60)
-            
-            exported_files = []
-            
-            if export_report in ['txt', 'all']:
-                filepath = report_generator.export_to_txt(report_data)
-                console.print(f"[green]✓[/green] TXT report: {filepath}")
-                exported_files.append(filepath)
-            
-            if export_report in ['json', 'all']:
-                filepath = report_generator.export_to_json(report_data)
-                console.print(f"[green]✓[/green] JSON report: {filepath}")
-                exported_files.append(filepath)
             
-            if export_report in ['csv', 'all']:
-                filepath = report_generator.export_to_csv(report_data)
-                console.print(f"[green]✓[/green] CSV report: {filepath}")
-                exported_files.append(filepath)
+            # Export reports if requested
+            if export_report:
+                export_reports(report_generator, report_data, export_report)
             
-            console.print(f"\n[bold green]✓ Exported {len(exported_files)} report(s)[/bold green]")
+            if report_cache_path:
+                report_generator.save_cached_report(report_cache_path, report_data)
         
         # Summary
         if not summary:
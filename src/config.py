@@ -1,7 +1,9 @@
 """Configuration management for the investment advisor"""
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,13 +21,17 @@ REPORTS_DIR.mkdir(exist_ok=True)
 # Database configuration
 DB_PATH = os.getenv("DB_PATH", str(DATA_DIR / "market_data.db"))
 
+# Yahoo Finance download cache (seconds a download is reused; 0 disables)
+YF_CACHE_DIR = os.getenv("YF_CACHE_DIR", str(DATA_DIR / "yf_cache"))
+YF_CACHE_TTL = int(os.getenv("YF_CACHE_TTL", "3600"))
+
 # Application settings
 DEFAULT_RISK_TOLERANCE = os.getenv("DEFAULT_RISK_TOLERANCE", "moderate")
 HISTORICAL_YEARS = int(os.getenv("HISTORICAL_YEARS", "20"))
 NEWS_LOOKBACK_DAYS = int(os.getenv("NEWS_LOOKBACK_DAYS", "30"))
 VERBOSE_OUTPUT = os.getenv("VERBOSE_OUTPUT", "False").lower() == "true"
 
-# Market data tickers
+# Market data tickers (read-only)
 TICKERS = {
     "SP500": {
         "ticker": "^GSPC",
@@ -58,6 +64,7 @@ TICKERS = {
         "name": "EUR/USD"
     }
 }
+TICKERS = MappingProxyType({name: MappingProxyType(cfg) for name, cfg in TICKERS.items()})
 
 # Economic indicators (FRED data)
 # Note: Requires FRED API key from https://fred.stlouisfed.org/docs/api/api_key.html
@@ -89,52 +96,61 @@ ECONOMIC_INDICATORS = {
 # FRED API configuration
 FRED_API_KEY = os.getenv("FRED_API_KEY", None)
 FRED_API_URL = "https://api.stlouisfed.org/fred/series/observations"
+# Last full M2 download per series, revalidated with If-Modified-Since
+FRED_CACHE_DIR = os.getenv("FRED_CACHE_DIR", str(DATA_DIR / "fred_cache"))
 
 # Technical analysis parameters
-TECHNICAL_PARAMS = {
-    "rsi_period": 14,
-    "rsi_oversold": 30,
-    "rsi_overbought": 70,
-    "ma_short": 50,
-    "ma_long": 200,
-    "macd_fast": 12,
-    "macd_slow": 26,
-    "macd_signal": 9,
-    "lookback_window": 30  # For dip detection
-}
+@dataclass(frozen=True, slots=True)
+class TechnicalParams:
+    rsi_period: int = 14
+    rsi_oversold: int = 30
+    rsi_overbought: int = 70
+    ma_short: int = 50
+    ma_long: int = 200
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    lookback_window: int = 30  # For dip detection
+
+
+TECHNICAL_PARAMS = TechnicalParams()
+
 
 # Decision engine thresholds
-DECISION_PARAMS = {
-    "dip_threshold_moderate": -3.0,
-    "dip_threshold_significant": -5.0,
-    "recession_high_threshold": 0.5,
-    "recession_moderate_threshold": 0.3,
-    "ai_bubble_high_threshold": 0.6,
-    "ai_bubble_moderate_threshold": 0.4,
-    "currency_risk_high": 2.5,
-    "currency_risk_moderate": 1.5,
+@dataclass(frozen=True, slots=True)
+class DecisionParams:
+    dip_threshold_moderate: float = -3.0
+    dip_threshold_significant: float = -5.0
+    recession_high_threshold: float = 0.5
+    recession_moderate_threshold: float = 0.3
+    ai_bubble_high_threshold: float = 0.6
+    ai_bubble_moderate_threshold: float = 0.4
+    currency_risk_high: float = 2.5
+    currency_risk_moderate: float = 1.5
     # M2 Money Supply thresholds
-    "m2_growth_positive": 2.0,      # >2% YoY growth is positive
-    "m2_growth_strong": 5.0,        # >5% YoY growth is strong positive
-    "m2_growth_negative": -2.0,     # <-2% YoY growth is negative
-    "m2_lookback_months": 12        # Compare to 12 months ago
-}
+    m2_growth_positive: float = 2.0      # >2% YoY growth is positive
+    m2_growth_strong: float = 5.0        # >5% YoY growth is strong positive
+    m2_growth_negative: float = -2.0     # <-2% YoY growth is negative
+    m2_lookback_months: int = 12         # Compare to 12 months ago
 
-# Risk profiles
-RISK_PROFILES = {
-    "conservative": {
+
+DECISION_PARAMS = DecisionParams()
+
+# Risk profiles (read-only)
+RISK_PROFILES = MappingProxyType({
+    "conservative": MappingProxyType({
         "strong_buy_score": 60,
         "buy_score": 40,
         "hold_score": 20
-    },
-    "moderate": {
+    }),
+    "moderate": MappingProxyType({
         "strong_buy_score": 50,
         "buy_score": 30,
         "hold_score": 10
-    },
-    "aggressive": {
+    }),
+    "aggressive": MappingProxyType({
         "strong_buy_score": 40,
         "buy_score": 20,
         "hold_score": 0
-    }
-}
+    })
+})
@@ -1,13 +1,18 @@
 """Data collection from Yahoo Finance using yfinance"""
 
+import hashlib
+import os
+import time
 import yfinance as yf
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, Tuple
+import numpy as np
 import pandas as pd
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.config import TICKERS, HISTORICAL_YEARS
+from src.config import TICKERS, HISTORICAL_YEARS, YF_CACHE_DIR, YF_CACHE_TTL
 
 console = Console()
 
@@ -15,9 +20,44 @@ console = Console()
 class DataCollector:
     """Collects market data from Yahoo Finance"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.tickers = TICKERS
         self.historical_years = HISTORICAL_YEARS
+        self.cache_dir = Path(YF_CACHE_DIR)
+        self.cache_ttl = YF_CACHE_TTL if use_cache else 0
+    
+    def _download(self, tickers: str, start: str, end: str, **kwargs) -> pd.DataFrame:
+        """
+        yf.download with an on-disk cache keyed by (tickers, start, end, options)
+        
+        Non-empty results are reused for cache_ttl seconds so same-day reruns
+        don't hit the network again.
+        """
+        if self.cache_ttl <= 0:
+            return yf.download(tickers, start=start, end=end, **kwargs)
+        
+        key = repr((tickers, start, end, sorted(kwargs.items())))
+        cache_file = self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pkl"
+        
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                return pd.read_pickle(cache_file)
+        except Exception:  # missing, truncated or otherwise unreadable
+            pass
+        
+        data = yf.download(tickers, start=start, end=end, **kwargs)
+        
+        if not data.empty:
+            try:
+                # Written aside and renamed so an interrupted run never leaves a partial file
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                data.to_pickle(tmp_file)
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                pass
+        
+        return data
     
     def download_historical_data(self, ticker: str, years: int = None) -> pd.DataFrame:
         """
@@ -44,7 +84,7 @@ class DataCollector:
             ) as progress:
                 task = progress.add_task(f"Downloading {ticker}...", total=None)
                 
-                data = yf.download(
+                data = self._download(
                     ticker,
                     start=start_date.strftime('%Y-%m-%d'),
                     end=end_date.strftime('%Y-%m-%d'),
@@ -82,18 +122,17 @@ class DataCollector:
             DataFrame with new data
         """
         try:
-            last_dt = datetime.strptime(last_date, '%Y-%m-%d')
-            start_date = last_dt + timedelta(days=1)
-            end_date = datetime.now()
+            start_date = (pd.Timestamp(last_date) + pd.Timedelta(days=1)).date()
+            end_date = pd.Timestamp.now().date()
             
             # If dates are the same or start > end, no new data needed
-            if start_date.date() >= end_date.date():
+            if start_date >= end_date:
                 return pd.DataFrame()
             
-            data = yf.download(
+            data = self._download(
                 ticker,
-                start=start_date.strftime('%Y-%m-%d'),
-                end=end_date.strftime('%Y-%m-%d'),
+                start=start_date.isoformat(),
+                end=end_date.isoformat(),
                 progress=False,
                 auto_adjust=False
             )
@@ -111,8 +150,28 @@ class DataCollector:
             console.print(f"[red]✗[/red] Error downloading incremental data for {ticker}: {str(e)}")
             return pd.DataFrame()
     
-    def get_current_price(self, ticker: str) -> Optional[float]:
-        """Get the current/latest price for a ticker"""
+    @staticmethod
+    def get_latest_from_frame(df: Optional[pd.DataFrame]) -> Optional[float]:
+        """Get the latest close from an already-downloaded frame (no network request)"""
+        if df is None or df.empty or 'Close' not in df.columns:
+            return None
+        
+        close = df['Close'].dropna()
+        return float(close.iloc[-1]) if not close.empty else None
+    
+    def get_current_price(self, ticker: str, data: Optional[pd.DataFrame] = None) -> Optional[float]:
+        """
+        Get the current/latest price for a ticker
+        
+        Args:
+            ticker: Yahoo Finance ticker symbol
+            data: Optional frame already downloaded for the ticker; its last close
+                  is used instead of fetching the (large) quote info payload
+        """
+        latest = self.get_latest_from_frame(data)
+        if latest is not None:
+            return latest
+        
         try:
             ticker_obj = yf.Ticker(ticker)
             info = ticker_obj.info
@@ -139,12 +198,53 @@ class DataCollector:
         console.print("\n[bold cyan]📊 Downloading Market Data[/bold cyan]")
         console.print("━" * 50)
         
+        # Fetch every ticker in one threaded request; per-ticker downloads remain the fallback
+        symbols = [config['ticker'] for config in self.tickers.values()]
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=self.historical_years * 365)
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task(f"Downloading {len(symbols)} tickers...", total=None)
+                
+                batch = self._download(
+                    " ".join(symbols),
+                    start=start_date.strftime('%Y-%m-%d'),
+                    end=end_date.strftime('%Y-%m-%d'),
+                    progress=False,
+                    auto_adjust=False,
+                    group_by='ticker',
+                    threads=True
+                )
+                
+                progress.update(task, completed=True)
+        except Exception as e:
+            console.print(f"[yellow]⚠[/yellow] Batch download failed, retrying per ticker: {str(e)}")
+            batch = pd.DataFrame()
+        
+        batch_tickers = set()
+        if isinstance(batch.columns, pd.MultiIndex):
+            batch_tickers = set(batch.columns.get_level_values(0))
+        
         for index_name, config in self.tickers.items():
             ticker = config['ticker']
             name = config['name']
             
             console.print(f"\n[bold]{name}[/bold] ({ticker})")
-            data = self.download_historical_data(ticker)
+            
+            data = pd.DataFrame()
+            if ticker in batch_tickers:
+                # The batch is aligned on the union of all calendars
+                data = batch[ticker].dropna(how='all')
+            
+            if data.empty:
+                data = self.download_historical_data(ticker)
+            else:
+                console.print(f"[green]✓[/green] Downloaded {len(data)} days for {ticker}")
             
             if not data.empty:
                 results[index_name] = data
@@ -197,29 +297,31 @@ class DataCollector:
         sp500_close_col = 'Adj Close' if 'Adj Close' in sp500_data.columns else 'adj_close' if 'adj_close' in sp500_data.columns else 'close'
         eurusd_close_col = 'Adj Close' if 'Adj Close' in eur_usd_data.columns else 'adj_close' if 'adj_close' in eur_usd_data.columns else 'close'
         
-        # Align data by date
-        df = pd.DataFrame()
-        df['sp500_usd_price'] = sp500_data[sp500_close_col]
-        df['eur_usd_rate'] = eur_usd_data[eurusd_close_col]
-        
-        # Remove NaN values
-        df = df.dropna()
-        
-        # Calculate EUR price
-        df['sp500_eur_price'] = df['sp500_usd_price'] / df['eur_usd_rate']
-        
-        # Calculate returns
-        df['sp500_usd_return'] = df['sp500_usd_price'].pct_change() * 100
-        df['sp500_eur_return'] = df['sp500_eur_price'].pct_change() * 100
-        df['currency_return'] = df['eur_usd_rate'].pct_change() * 100
-        
-        # Currency impact
-        df['currency_impact'] = df['sp500_eur_return'] - df['sp500_usd_return']
-        
-        # Remove first row (NaN from pct_change)
-        df = df.iloc[1:]
-        
-        return df
+        # Align data by date and drop incomplete rows
+        prices = pd.concat(
+            [sp500_data[sp500_close_col], eur_usd_data[eurusd_close_col]],
+            axis=1,
+            join='inner',
+            keys=['sp500_usd_price', 'eur_usd_rate']
+        ).dropna()
+        
+        usd_price = prices['sp500_usd_price'].to_numpy(dtype=np.float64)
+        eur_usd_rate = prices['eur_usd_rate'].to_numpy(dtype=np.float64)
+        eur_price = usd_price / eur_usd_rate
+        
+        # Day-over-day returns (same as pct_change, without the leading NaN row)
+        usd_return = (usd_price[1:] / usd_price[:-1] - 1) * 100
+        eur_return = (eur_price[1:] / eur_price[:-1] - 1) * 100
+        
+        return pd.DataFrame({
+            'sp500_usd_price': usd_price[1:],
+            'eur_usd_rate': eur_usd_rate[1:],
+            'sp500_eur_price': eur_price[1:],
+            'sp500_usd_return': usd_return,
+            'sp500_eur_return': eur_return,
+            'currency_return': (eur_usd_rate[1:] / eur_usd_rate[:-1] - 1) * 100,
+            'currency_impact': eur_return - usd_return
+        }, index=prices.index[1:].rename(sp500_data.index.name))
     
     def validate_data(self, df: pd.DataFrame, ticker: str) -> Tuple[bool, str]:
         """
@@ -238,8 +340,8 @@ class DataCollector:
         if missing_cols:
             return False, f"Missing columns: {', '.join(missing_cols)}"
         
-        # Check for excessive NaN values
-        nan_pct = (df.isnull().sum() / len(df) * 100).max()
+        # Check for excessive NaN values (worst column of the whole frame)
+        nan_pct = float(df.isna().to_numpy().mean(axis=0).max() * 100)
         if nan_pct > 10:
             return False, f"Too many missing values: {nan_pct:.1f}%"
         
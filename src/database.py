@@ -1,35 +1,251 @@
 """Database operations for storing market data and recommendations"""
 
+import csv
+import logging
 import sqlite3
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+import numpy as np
 import pandas as pd
-from rich.console import Console
 
 from src.config import DB_PATH
 
-console = Console()
+# Progress messages go through logging (rich markup in the text); the CLI
+# renders them with configure_rich_logging(), headless callers can ignore them
+log = logging.getLogger(__name__)
+
+
+def configure_rich_logging(console=None, level: int = logging.INFO):
+    """Render this module's log messages on the terminal (or given rich Console)"""
+    from rich.logging import RichHandler
+    
+    if any(isinstance(handler, RichHandler) for handler in log.handlers):
+        return
+    
+    handler = RichHandler(console=console, show_time=False, show_level=False, show_path=False, markup=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(level)
+    log.propagate = False
+
+
+# Date-like parameters bind as YYYY-MM-DD text, matching the DATE columns, so
+# callers can pass Timestamps / datetime64 bounds without formatting them first
+sqlite3.register_adapter(pd.Timestamp, lambda ts: ts.strftime('%Y-%m-%d'))
+sqlite3.register_adapter(np.datetime64, lambda d: np.datetime_as_string(d, unit='D'))
+
+
+def _to_iso_dates(dates) -> List[str]:
+    """Format dates as YYYY-MM-DD strings via one vectorized datetime64[D] cast"""
+    dates = pd.DatetimeIndex(dates)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)  # keep the exchange-local calendar day
+    return dates.to_numpy(dtype='datetime64[D]').astype(str).tolist()
 
 
 class Database:
     """Handles all SQLite database operations"""
     
+    # Hot statements kept as constants so every call hits the connection's
+    # prepared-statement cache with identical SQL text
+    # Price upsert, split around the VALUES list for _insert_multirow
+    _SQL_INSERT_PRICES = """
+        INSERT INTO historical_prices 
+        (index_name, date, open, high, low, close, adj_close, volume)
+    """
+    _SQL_PRICES_CONFLICT = """
+        ON CONFLICT(index_name, date) DO UPDATE SET
+            open = excluded.open, high = excluded.high, low = excluded.low,
+            close = excluded.close, adj_close = excluded.adj_close, volume = excluded.volume
+    """
+    # Rows per multi-row INSERT (also capped by the bound-parameter limit)
+    _MULTIROW_CHUNK = 500
+    # Bound-parameter limit assumed when Connection.getlimit is unavailable
+    # (Python < 3.11); 999 is SQLite's historical compile-time default
+    _DEFAULT_VARIABLE_LIMIT = 999
+    _PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'adj_close', 'volume')
+    # Rows converted to arrays per fetchmany() call in get_historical_prices
+    _FETCH_CHUNK_ROWS = 20000
+    _SQL_INSERT_CURRENCY_RETURNS = """
+        INSERT INTO currency_adjusted_returns 
+        (date, sp500_usd_price, sp500_eur_price, eur_usd_rate, 
+         sp500_usd_return, sp500_eur_return, currency_impact)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(date) DO UPDATE SET
+            sp500_usd_price = excluded.sp500_usd_price, sp500_eur_price = excluded.sp500_eur_price,
+            eur_usd_rate = excluded.eur_usd_rate, sp500_usd_return = excluded.sp500_usd_return,
+            sp500_eur_return = excluded.sp500_eur_return, currency_impact = excluded.currency_impact
+    """
+    _CURRENCY_RETURN_COLUMNS = ('sp500_usd_price', 'sp500_eur_price', 'eur_usd_rate',
+                                'sp500_usd_return', 'sp500_eur_return', 'currency_impact')
+    _SQL_INSERT_INDICATOR = """
+        INSERT INTO economic_indicators 
+        (indicator_name, date, value)
+        VALUES (?, ?, ?)
+        ON CONFLICT(indicator_name, date) DO UPDATE SET value = excluded.value
+    """
+    # Latest date as one reverse seek on the (name, date) UNIQUE index (no row when empty)
+    _SQL_LAST_PRICE_DATE = """
+        SELECT date FROM historical_prices WHERE index_name = ?
+        ORDER BY date DESC LIMIT 1
+    """
+    _SQL_LAST_INDICATOR_DATE = """
+        SELECT date FROM economic_indicators WHERE indicator_name = ?
+        ORDER BY date DESC LIMIT 1
+    """
+    _SQL_SET_METADATA = """
+        INSERT OR REPLACE INTO metadata (key, value, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+    """
+    _SQL_GET_METADATA = "SELECT value FROM metadata WHERE key = ?"
+    # Row count from the trigger-maintained per-index counter (see
+    # ensure_row_counters), first/last date from two seeks on the
+    # (index_name, date) index; COALESCE only counts when no counter exists
+    _SQL_PRICE_STATS = """
+        SELECT COALESCE((SELECT CAST(value AS INTEGER) FROM metadata WHERE key = 'price_count_' || :index_name),
+                        (SELECT COUNT(*) FROM historical_prices WHERE index_name = :index_name)) as count,
+               (SELECT MIN(date) FROM historical_prices WHERE index_name = :index_name) as first_date,
+               (SELECT MAX(date) FROM historical_prices WHERE index_name = :index_name) as last_date
+    """
+    # YoY/MoM changes are derived on read with window functions over the stored
+    # levels (12 / 1 observations back, like pandas pct_change on monthly data),
+    # so they stay correct after partial updates and backfills
+    _SQL_INDICATOR_CHANGES = """
+        SELECT date, value,
+               (value / LAG(value, 12) OVER (ORDER BY date) - 1) * 100 as yoy_change,
+               (value / LAG(value, 1) OVER (ORDER BY date) - 1) * 100 as mom_change
+        FROM economic_indicators
+        WHERE indicator_name = ?
+    """
+    _INDICATOR_COLUMNS = ('value', 'yoy_change', 'mom_change')
+    # Per-indicator counts and date range; latest_yoy comes from yoy_rank 1, the
+    # newest row with a non-null YoY change
+    _SQL_INDICATOR_STATS = """
+        SELECT indicator_name, COUNT(*) as count, MIN(date) as first_date, MAX(date) as last_date,
+               MAX(CASE WHEN yoy_rank = 1 THEN yoy_change END) as latest_yoy
+        FROM (
+            SELECT indicator_name, date, yoy_change,
+                   ROW_NUMBER() OVER (PARTITION BY indicator_name
+                                      ORDER BY yoy_change IS NULL, date DESC) as yoy_rank
+            FROM (
+                SELECT indicator_name, date,
+                       (value / LAG(value, 12) OVER (PARTITION BY indicator_name ORDER BY date) - 1) * 100 as yoy_change
+                FROM economic_indicators
+            )
+        )
+        GROUP BY indicator_name
+    """
+    # Trigger-maintained counters (see ensure_row_counters), falling back to a
+    # full COUNT(*) on databases that do not have them yet
+    _SQL_ROW_COUNTS = """
+        SELECT COALESCE((SELECT CAST(value AS INTEGER) FROM metadata WHERE key = 'news_count'),
+                        (SELECT COUNT(*) FROM news_articles)) as news_count,
+               COALESCE((SELECT CAST(value AS INTEGER) FROM metadata WHERE key = 'recommendation_count'),
+                        (SELECT COUNT(*) FROM recommendations_log)) as recommendation_count
+    """
+    _SQL_DB_SIZE = "SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()"
+    # Counter key in metadata for each counted table
+    _ROW_COUNTERS = {'news_articles': 'news_count', 'recommendations_log': 'recommendation_count'}
+    # Latest level, YoY change and date of every indicator in one pass (bare
+    # columns alongside MAX(date) come from each indicator's latest row)
+    _SQL_INDICATOR_SNAPSHOT = """
+        SELECT indicator_name, value, yoy_change, MAX(date) as date
+        FROM (
+            SELECT indicator_name, date, value,
+                   (value / LAG(value, 12) OVER (PARTITION BY indicator_name ORDER BY date) - 1) * 100 as yoy_change
+            FROM economic_indicators
+        )
+        GROUP BY indicator_name
+    """
+    _SQL_LOG_RECOMMENDATION = """
+        INSERT INTO recommendations_log 
+        (index_name, recommendation, confidence, price_at_recommendation, 
+         eur_usd_rate, currency_impact, reasoning, market_context)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    # Articles already stored (same URL) are skipped
+    _SQL_INSERT_NEWS = """
+        INSERT OR IGNORE INTO news_articles
+        (title, description, source, published_at, url, 
+         sentiment_score, sentiment_label, related_index)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    # Stamped in PRAGMA user_version by upgrade_schema; bump it whenever
+    # ensure_indexes / ensure_row_counters gain a step existing files need
+    _SCHEMA_VERSION = 1
+    
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        # Per-connection cache of price frames, keyed by (index_name, start_date, end_date)
+        self._price_cache: Dict[tuple, pd.DataFrame] = {}
+        # True while a bulk() transaction is open on this connection
+        self._in_bulk = False
+        # Latest-indicator snapshot and the PRAGMA data_version it was read at
+        # (other connections' commits bump it; our own writes clear the snapshot)
+        self._indicator_snapshot: Optional[Dict[str, Dict]] = None
+        self._indicator_snapshot_version: Optional[int] = None
     
     def connect(self):
         """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        # Autocommit mode: multi-statement writes go through bulk(), which issues
+        # an explicit BEGIN IMMEDIATE; single statements commit on their own
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256, isolation_level=None)
+        # WAL + NORMAL sync: one fsync per checkpoint instead of per commit
+        # (in-memory databases have no journal file to switch)
+        if self.db_path != ':memory:':
+            # 8 KB pages (shallower B-trees for the long price series) can only be
+            # chosen before the first table is created and before switching to WAL
+            if self.conn.execute("PRAGMA schema_version").fetchone()[0] == 0:
+                self.conn.execute("PRAGMA page_size=8192")
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+            self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
         return self.conn
     
+    def checkpoint(self):
+        """Fold the WAL back into the main database file and truncate it"""
+        if self.conn and self.db_path != ':memory:':
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
     
+    @contextmanager
+    def bulk(self):
+        """
+        Run the enclosed writes in a single BEGIN IMMEDIATE transaction
+        
+        Commits on success and rolls back on error. Nested uses (e.g. store_*
+        calls inside a caller's bulk() block) join the outer transaction.
+        """
+        if self._in_bulk:
+            yield self.conn
+            return
+        
+        if self.conn.in_transaction:
+            self.conn.commit()
+        
+        self._in_bulk = True
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_bulk = False
+    
     def __enter__(self):
         self.connect()
         return self
@@ -37,111 +253,238 @@ class Database:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
     
-    def initialize_schema(self):
-        """Create database tables if they don't exist"""
+    def initialize_schema(self, create_indexes: bool = True):
+        """
+        Create database tables if they don't exist
+        
+        Args:
+            create_indexes: Also build secondary indexes and row counters. Bulk
+                            loaders pass False and call upgrade_schema() after
+                            loading (UNIQUE constraints always exist)
+        """
         cursor = self.conn.cursor()
         
-        # Historical Prices table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS historical_prices (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                index_name TEXT NOT NULL,
-                date DATE NOT NULL,
-                open REAL,
-                high REAL,
-                low REAL,
-                close REAL,
-                adj_close REAL,
-                volume INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(index_name, date)
-            )
-        """)
-        
-        # Currency-Adjusted Returns Cache
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS currency_adjusted_returns (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date DATE NOT NULL,
-                sp500_usd_price REAL,
-                sp500_eur_price REAL,
-                eur_usd_rate REAL,
-                sp500_usd_return REAL,
-                sp500_eur_return REAL,
-                currency_impact REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(date)
-            )
-        """)
-        
-        # Economic Indicators table (M2, GDP, etc.)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS economic_indicators (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                indicator_name TEXT NOT NULL,
-                date DATE NOT NULL,
-                value REAL NOT NULL,
-                yoy_change REAL,
-                mom_change REAL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(indicator_name, date)
-            )
-        """)
-        
-        # News Articles table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS news_articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                source TEXT,
-                published_at TIMESTAMP,
-                url TEXT,
-                sentiment_score REAL,
-                sentiment_label TEXT,
-                related_index TEXT,
-                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Recommendations Log table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recommendations_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                index_name TEXT,
-                recommendation TEXT,
-                confidence REAL,
-                price_at_recommendation REAL,
-                eur_usd_rate REAL,
-                currency_impact TEXT,
-                reasoning TEXT,
-                market_context TEXT
-            )
-        """)
-        
-        # System Metadata table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        # All tables in one transaction (one journal sync instead of one per CREATE)
+        with self.bulk():
+            # Historical Prices table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS historical_prices (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    index_name TEXT NOT NULL,
+                    date DATE NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    adj_close REAL,
+                    volume INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(index_name, date)
+                )
+            """)
+            
+            # Currency-Adjusted Returns Cache
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS currency_adjusted_returns (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date DATE NOT NULL,
+                    sp500_usd_price REAL,
+                    sp500_eur_price REAL,
+                    eur_usd_rate REAL,
+                    sp500_usd_return REAL,
+                    sp500_eur_return REAL,
+                    currency_impact REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(date)
+                )
+            """)
+            
+            # Economic Indicators table (M2, GDP, etc.). yoy_change/mom_change are
+            # legacy columns that are no longer written: the changes are derived
+            # on read (_SQL_INDICATOR_CHANGES), so do not read them from the table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS economic_indicators (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    indicator_name TEXT NOT NULL,
+                    date DATE NOT NULL,
+                    value REAL NOT NULL,
+                    yoy_change REAL,
+                    mom_change REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(indicator_name, date)
+                )
+            """)
+            
+            # News Articles table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS news_articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    description TEXT,
+                    source TEXT,
+                    published_at TIMESTAMP,
+                    url TEXT,
+                    sentiment_score REAL,
+                    sentiment_label TEXT,
+                    related_index TEXT,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Recommendations Log table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS recommendations_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    index_name TEXT,
+                    recommendation TEXT,
+                    confidence REAL,
+                    price_at_recommendation REAL,
+                    eur_usd_rate REAL,
+                    currency_impact TEXT,
+                    reasoning TEXT,
+                    market_context TEXT
+                )
+            """)
+            
+            # System Metadata table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
         
         # Create indexes for better performance
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_prices_date 
-            ON historical_prices(index_name, date DESC)
-        """)
+        if create_indexes:
+            self.upgrade_schema()
+        log.info("[green]✓[/green] Database schema initialized")
+    
+    def upgrade_schema(self):
+        """
+        Bring indexes and row counters up to date, once per schema version
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_news_date 
-            ON news_articles(published_at DESC)
-        """)
+        The version is stamped in PRAGMA user_version (a file header field), so
+        opening an up-to-date database skips the sqlite_master probes entirely.
+        """
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] >= self._SCHEMA_VERSION:
+            return
         
-        self.conn.commit()
-        console.print("[green]✓[/green] Database schema initialized")
+        self.ensure_indexes()
+        self.ensure_row_counters()
+        self.conn.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
+    
+    def ensure_indexes(self):
+        """Create any missing secondary indexes (also upgrades databases built by older versions)"""
+        cursor = self.conn.cursor()
+        
+        # One transaction for the whole upgrade, including the URL clean-up below
+        with self.bulk():
+            # Covering index: get_historical_prices range scans are answered from the
+            # index leaves without a rowid lookup per bar. It also serves the
+            # (index_name, date) seeks idx_prices_date was created for
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_prices_cover 
+                ON historical_prices(index_name, date, open, high, low, close, adj_close, volume)
+            """)
+            cursor.execute("DROP INDEX IF EXISTS idx_prices_date")
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_news_date 
+                ON news_articles(published_at DESC)
+            """)
+            
+            # Covers get_recent_news(related_index=...) as a single range seek
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_news_related_published 
+                ON news_articles(related_index, published_at DESC)
+            """)
+            
+            # YoY is now derived on read (indicator_name/date seeks are served by the
+            # UNIQUE constraint's index), so the partial index on stored yoy_change is unused
+            cursor.execute("DROP INDEX IF EXISTS idx_econ_yoy_date")
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reco_index_ts 
+                ON recommendations_log(index_name, timestamp DESC)
+            """)
+            
+            # One row per article URL. Older databases may hold repeated fetches of the
+            # same article (and '' for missing links), so clean those up first
+            has_url_index = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_news_url'"
+            ).fetchone()
+            if not has_url_index:
+                cursor.execute("UPDATE news_articles SET url = NULL WHERE url = ''")
+                cursor.execute("""
+                    DELETE FROM news_articles
+                    WHERE url IS NOT NULL AND id NOT IN (
+                        SELECT MIN(id) FROM news_articles WHERE url IS NOT NULL GROUP BY url
+                    )
+                """)
+                cursor.execute("CREATE UNIQUE INDEX idx_news_url ON news_articles(url)")
+    
+    def ensure_row_counters(self):
+        """
+        Keep running row counts of the append-only tables in metadata
+        
+        Seeds each counter from one COUNT(*) and installs insert/delete triggers,
+        so get_database_stats reads a single metadata row instead of scanning.
+        Price rows are counted per index (price_count_<index_name>); upserts
+        that update an existing bar do not fire the insert trigger.
+        """
+        cursor = self.conn.cursor()
+        
+        for table, key in self._ROW_COUNTERS.items():
+            has_trigger = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (f'trg_{key}_insert',)
+            ).fetchone()
+            if has_trigger:
+                continue
+            
+            with self.bulk():
+                cursor.execute(f"""
+                    INSERT OR REPLACE INTO metadata (key, value, updated_at)
+                    SELECT '{key}', COUNT(*), CURRENT_TIMESTAMP FROM {table}
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER trg_{key}_insert AFTER INSERT ON {table}
+                    BEGIN
+                        UPDATE metadata SET value = CAST(value AS INTEGER) + 1 WHERE key = '{key}';
+                    END
+                """)
+                cursor.execute(f"""
+                    CREATE TRIGGER trg_{key}_delete AFTER DELETE ON {table}
+                    BEGIN
+                        UPDATE metadata SET value = CAST(value AS INTEGER) - 1 WHERE key = '{key}';
+                    END
+                """)
+        
+        has_trigger = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_price_count_insert'"
+        ).fetchone()
+        if not has_trigger:
+            with self.bulk():
+                cursor.execute("""
+                    INSERT OR REPLACE INTO metadata (key, value, updated_at)
+                    SELECT 'price_count_' || index_name, COUNT(*), CURRENT_TIMESTAMP
+                    FROM historical_prices GROUP BY index_name
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER trg_price_count_insert AFTER INSERT ON historical_prices
+                    BEGIN
+                        INSERT INTO metadata (key, value) VALUES ('price_count_' || NEW.index_name, 1)
+                        ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1;
+                    END
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER trg_price_count_delete AFTER DELETE ON historical_prices
+                    BEGIN
+                        UPDATE metadata SET value = CAST(value AS INTEGER) - 1
+                        WHERE key = 'price_count_' || OLD.index_name;
+                    END
+                """)
     
     def store_historical_prices(self, index_name: str, df: pd.DataFrame):
         """
@@ -152,44 +495,51 @@ class Database:
             df: DataFrame with columns: Date, Open, High, Low, Close, Adj Close, Volume
         """
         if df.empty:
-            console.print(f"[yellow]⚠[/yellow] No data to store for {index_name}")
+            log.warning("[yellow]⚠[/yellow] No data to store for %s", index_name)
             return
         
-        df = df.copy()
-        df.reset_index(inplace=True)
-        df['index_name'] = index_name
-        
-        # Rename columns to match database schema
-        df.rename(columns={
-            'Date': 'date',
-            'Open': 'open',
-            'High': 'high',
-            'Low': 'low',
-            'Close': 'close',
-            'Adj Close': 'adj_close',
-            'Volume': 'volume'
-        }, inplace=True)
-        
-        # Select only the columns we need
-        columns = ['index_name', 'date', 'open', 'high', 'low', 'close', 'adj_close', 'volume']
-        df = df[columns]
-        
-        # Convert date to string format for SQLite compatibility
-        df['date'] = df['date'].dt.strftime('%Y-%m-%d')
-        
-        # Insert or replace records
-        cursor = self.conn.cursor()
-        records = df.to_dict('records')
+        # Build the rows straight from the column arrays (dates as YYYY-MM-DD
+        # strings for SQLite) instead of reshaping a copy of the frame
+        dates = _to_iso_dates(df.index)
+        price_columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+        rows = zip([index_name] * len(df), dates, *(df[col].tolist() for col in price_columns))
         
-        for record in records:
-            cursor.execute("""
-                INSERT OR REPLACE INTO historical_prices 
-                (index_name, date, open, high, low, close, adj_close, volume)
-                VALUES (:index_name, :date, :open, :high, :low, :close, :adj_close, :volume)
-            """, record)
+        # Upsert records in multi-row statements (keeps id and created_at)
+        with self.bulk():
+            self._insert_multirow(self._SQL_INSERT_PRICES, self._SQL_PRICES_CONFLICT, rows, width=8)
         
-        self.conn.commit()
-        console.print(f"[green]✓[/green] Stored {len(df)} records for {index_name}")
+        self._invalidate_price_cache(index_name)
+        log.info("[green]✓[/green] Stored %d records for %s", len(df), index_name)
+    
+    def _insert_multirow(self, insert_sql: str, conflict_sql: str, rows, width: int):
+        """
+        Insert rows with multi-row VALUES lists of up to _MULTIROW_CHUNK rows
+        
+        SQLite parses and steps one statement per chunk instead of one per row
+        as with executemany; full chunks share the same SQL text, so they are
+        served from the statement cache.
+        """
+        getlimit = getattr(self.conn, 'getlimit', None)
+        if getlimit is not None:
+            max_variables = getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        else:
+            max_variables = self._DEFAULT_VARIABLE_LIMIT
+        max_rows = max_variables // width
+        chunk_rows = max(1, min(self._MULTIROW_CHUNK, max_rows))
+        placeholders = '(' + ', '.join(['?'] * width) + ')'
+        
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                break
+            values = ', '.join([placeholders] * len(chunk))
+            self.conn.execute(f"{insert_sql} VALUES {values} {conflict_sql}", list(chain.from_iterable(chunk)))
+    
+    def _invalidate_price_cache(self, index_name: str):
+        """Drop cached price frames for an index after its rows change"""
+        for key in [k for k in self._price_cache if k[0] == index_name]:
+            del self._price_cache[key]
     
     def get_historical_prices(self, index_name: str, start_date: Optional[str] = None, 
                              end_date: Optional[str] = None) -> pd.DataFrame:
@@ -198,12 +548,17 @@ class Database:
         
         Args:
             index_name: Name of the index
-            start_date: Start date (YYYY-MM-DD format)
-            end_date: End date (YYYY-MM-DD format)
+            start_date: Start date (YYYY-MM-DD string or Timestamp)
+            end_date: End date (YYYY-MM-DD string or Timestamp)
         
         Returns:
             DataFrame with historical prices
         """
+        cache_key = (index_name, start_date, end_date)
+        cached = self._price_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+        
         query = """
             SELECT date, open, high, low, close, adj_close, volume
             FROM historical_prices
@@ -221,99 +576,103 @@ class Database:
         
         query += " ORDER BY date ASC"
         
-        df = pd.read_sql_query(query, self.conn, params=params, parse_dates=['date'])
-        
-        if not df.empty:
-            df.set_index('date', inplace=True)
-        
-        return df
+        # Fetch plain tuples in chunks and build typed column arrays directly,
+        # skipping read_sql_query's per-value type inference and date parsing;
+        # only one chunk of row tuples is alive at a time
+        cursor = self.conn.execute(query, params)
+        date_chunks, value_chunks = [], []
+        while True:
+            rows = cursor.fetchmany(self._FETCH_CHUNK_ROWS)
+            if not rows:
+                break
+            dates, *values = zip(*rows)
+            date_chunks.append(np.array(dates, dtype='datetime64[ns]'))
+            value_chunks.append(np.array(values, dtype=np.float64))
+        
+        if date_chunks:
+            values = np.concatenate(value_chunks, axis=1)
+            columns = dict(zip(self._PRICE_COLUMNS, values))
+            # Volume stays integer unless some bars are missing it (NULL -> NaN)
+            if not np.isnan(columns['volume']).any():
+                columns['volume'] = columns['volume'].astype(np.int64)
+            index = pd.DatetimeIndex(np.concatenate(date_chunks), name='date')
+            df = pd.DataFrame(columns, index=index)
+        else:
+            df = pd.DataFrame(columns=['date', *self._PRICE_COLUMNS]).astype({'date': 'datetime64[ns]'})
+        
+        self._price_cache[cache_key] = df
+        return df.copy()
     
     def get_last_update_date(self, index_name: str) -> Optional[str]:
         """Get the date of the most recent data for an index"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT MAX(date) as last_date
-            FROM historical_prices
-            WHERE index_name = ?
-        """, (index_name,))
-        
-        result = cursor.fetchone()
-        return result['last_date'] if result and result['last_date'] else None
+        result = self.conn.execute(self._SQL_LAST_PRICE_DATE, (index_name,)).fetchone()
+        return result[0] if result and result[0] else None
+    
+    def get_last_indicator_date(self, indicator_name: str) -> Optional[str]:
+        """Get the date of the most recent observation for an economic indicator"""
+        result = self.conn.execute(self._SQL_LAST_INDICATOR_DATE, (indicator_name,)).fetchone()
+        return result[0] if result and result[0] else None
     
     def set_metadata(self, key: str, value: str):
         """Store or update a metadata value"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO metadata (key, value, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-        """, (key, value))
-        self.conn.commit()
+        with self.bulk():
+            self.conn.execute(self._SQL_SET_METADATA, (key, value))
+    
+    def set_metadata_many(self, items: Dict[str, str]):
+        """Store or update several metadata values in one transaction"""
+        with self.bulk():
+            self.conn.executemany(self._SQL_SET_METADATA, items.items())
     
     def get_metadata(self, key: str) -> Optional[str]:
         """Retrieve a metadata value"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT value FROM metadata WHERE key = ?", (key,))
-        result = cursor.fetchone()
-        return result['value'] if result else None
+        result = self.conn.execute(self._SQL_GET_METADATA, (key,)).fetchone()
+        return result[0] if result else None
     
     def database_exists(self) -> bool:
         """Check if the database file exists and has tables"""
         if not Path(self.db_path).exists():
             return False
         
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='historical_prices'
-        """)
-        return cursor.fetchone() is not None
+        # schema_version is read from the file header and stays 0 until the first
+        # CREATE; initialize_schema creates every table in one pass
+        return self.conn.execute("PRAGMA schema_version").fetchone()[0] > 0
     
     def get_database_stats(self) -> Dict[str, Any]:
         """Get statistics about the database"""
+        # Named-column rows only here; the hot lookups elsewhere read plain tuples
         cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
         
         stats = {}
         
         # Count records for each index
         for index_name in ['SP500', 'CW8', 'EURUSD']:
-            cursor.execute("""
-                SELECT COUNT(*) as count, MIN(date) as first_date, MAX(date) as last_date
-                FROM historical_prices
-                WHERE index_name = ?
-            """, (index_name,))
-            result = cursor.fetchone()
+            result = cursor.execute(self._SQL_PRICE_STATS, {'index_name': index_name}).fetchone()
             stats[index_name] = {
                 'records': result['count'],
                 'first_date': result['first_date'],
                 'last_date': result['last_date']
             }
         
-        # News articles count
-        cursor.execute("SELECT COUNT(*) as count FROM news_articles")
-        stats['news_articles'] = cursor.fetchone()['count']
-        
-        # Recommendations count
-        cursor.execute("SELECT COUNT(*) as count FROM recommendations_log")
-        stats['recommendations'] = cursor.fetchone()['count']
+        # News articles and recommendations counts
+        cursor.execute(self._SQL_ROW_COUNTS)
+        counts = cursor.fetchone()
+        stats['news_articles'] = counts['news_count']
+        stats['recommendations'] = counts['recommendation_count']
         
-        # Database file size
-        stats['db_size_mb'] = Path(self.db_path).stat().st_size / (1024 * 1024)
+        # Database size as SQLite sees it (includes pages still in the WAL; no file stat)
+        cursor.execute(self._SQL_DB_SIZE)
+        stats['db_size_mb'] = cursor.fetchone()['size'] / (1024 * 1024)
         
-        # M2 Money Supply stats (US and Eurozone)
+        # M2 Money Supply stats and latest YoY growth (US and Eurozone, one grouped scan)
+        cursor.execute(self._SQL_INDICATOR_STATS)
+        indicator_stats = {row['indicator_name']: row for row in cursor.fetchall()}
         for m2_region in ['M2_US', 'M2_EUROZONE']:
-            cursor.execute("""
-                SELECT COUNT(*) as count, MIN(date) as first_date, MAX(date) as last_date
-                FROM economic_indicators
-                WHERE indicator_name = ?
-            """, (m2_region,))
-            m2_result = cursor.fetchone()
+            m2_result = indicator_stats.get(m2_region)
             stats[f'{m2_region.lower()}_records'] = m2_result['count'] if m2_result else 0
             stats[f'{m2_region.lower()}_first_date'] = m2_result['first_date'] if m2_result else None
             stats[f'{m2_region.lower()}_last_date'] = m2_result['last_date'] if m2_result else None
-        
-        # Latest M2 YoY growth for both regions
-        stats['m2_us_yoy_growth'] = self.get_latest_m2_growth('M2_US')
-        stats['m2_eurozone_yoy_growth'] = self.get_latest_m2_growth('M2_EUROZONE')
+            stats[f'{m2_region.lower()}_yoy_growth'] = m2_result['latest_yoy'] if m2_result else None
         
         # Backward compatibility
         stats['m2_records'] = stats['m2_us_records']
@@ -326,46 +685,41 @@ class Database:
         if df.empty:
             return
         
-        df = df.copy()
-        
-        # Reset index to get date as a column
-        df.reset_index(inplace=True)
-        
-        # Rename index column to 'date' if needed
-        if df.columns[0] != 'date':
-            df.rename(columns={df.columns[0]: 'date'}, inplace=True)
+        # Positional rows zipped from the column arrays (date index as YYYY-MM-DD)
+        dates = _to_iso_dates(df.index)
+        rows = zip(dates, *(df[col].tolist() for col in self._CURRENCY_RETURN_COLUMNS))
         
-        # Convert date to string format for SQLite compatibility
-        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
-        
-        cursor = self.conn.cursor()
-        records = df.to_dict('records')
-        
-        for record in records:
-            cursor.execute("""
-                INSERT OR REPLACE INTO currency_adjusted_returns 
-                (date, sp500_usd_price, sp500_eur_price, eur_usd_rate, 
-                 sp500_usd_return, sp500_eur_return, currency_impact)
-                VALUES (:date, :sp500_usd_price, :sp500_eur_price, :eur_usd_rate,
-                        :sp500_usd_return, :sp500_eur_return, :currency_impact)
-            """, record)
-        
-        self.conn.commit()
+        with self.bulk():
+            self.conn.executemany(self._SQL_INSERT_CURRENCY_RETURNS, rows)
     
     def log_recommendation(self, index_name: str, recommendation: str, confidence: float,
                           price: float, eur_usd_rate: Optional[float] = None,
                           currency_impact: Optional[str] = None, reasoning: Optional[str] = None,
                           market_context: Optional[str] = None):
         """Log an investment recommendation"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO recommendations_log 
-            (index_name, recommendation, confidence, price_at_recommendation, 
-             eur_usd_rate, currency_impact, reasoning, market_context)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (index_name, recommendation, confidence, price, eur_usd_rate, 
-              currency_impact, reasoning, market_context))
-        self.conn.commit()
+        self.log_recommendations([{
+            'index_name': index_name, 'recommendation': recommendation,
+            'confidence': confidence, 'price': price, 'eur_usd_rate': eur_usd_rate,
+            'currency_impact': currency_impact, 'reasoning': reasoning,
+            'market_context': market_context
+        }])
+    
+    def log_recommendations(self, recommendations: List[Dict[str, Any]]):
+        """
+        Log several recommendations in one transaction
+        
+        Args:
+            recommendations: Dicts with the log_recommendation() argument names
+                             (index_name, recommendation, confidence, price required)
+        """
+        rows = (
+            (rec['index_name'], rec['recommendation'], rec['confidence'], rec['price'],
+             rec.get('eur_usd_rate'), rec.get('currency_impact'), rec.get('reasoning'),
+             rec.get('market_context'))
+            for rec in recommendations
+        )
+        with self.bulk():
+            self.conn.executemany(self._SQL_LOG_RECOMMENDATION, rows)
     
     def export_to_csv(self, output_dir: str = "data"):
         """Export all tables to CSV files for backup"""
@@ -376,10 +730,14 @@ class Database:
                  'news_articles', 'recommendations_log', 'metadata']
         
         for table in tables:
-            df = pd.read_sql_query(f"SELECT * FROM {table}", self.conn)
+            # Stream rows from the cursor rather than materializing a DataFrame
+            cursor = self.conn.execute(f"SELECT * FROM {table}")
             csv_path = output_path / f"{table}.csv"
-            df.to_csv(csv_path, index=False)
-            console.print(f"[green]✓[/green] Exported {table} to {csv_path}")
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow([column[0] for column in cursor.description])
+                writer.writerows(cursor)
+            log.info("[green]✓[/green] Exported %s to %s", table, csv_path)
     
     def store_economic_indicator(self, indicator_name: str, df: pd.DataFrame):
         """
@@ -392,38 +750,16 @@ class Database:
         if df.empty:
             return
         
-        df = df.copy()
-        
-        # Reset index to get date as a column
-        df.reset_index(inplace=True)
-        
-        # Rename index column to 'date' if needed
-        if df.columns[0] != 'date':
-            df.rename(columns={df.columns[0]: 'date'}, inplace=True)
-        
-        # Convert date to string format
-        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+        # Rows zipped from the date index and value array (no per-row dicts or frame copy)
+        dates = _to_iso_dates(df.index)
+        rows = zip([indicator_name] * len(df), dates, df['value'].tolist())
         
-        # Calculate year-over-year change
-        if 'value' in df.columns:
-            df = df.sort_values('date')
-            df['yoy_change'] = df['value'].pct_change(12) * 100  # 12 months for YoY
-            df['mom_change'] = df['value'].pct_change(1) * 100   # Month over month
+        # Only levels are stored; YoY/MoM changes are computed on read
+        with self.bulk():
+            self.conn.executemany(self._SQL_INSERT_INDICATOR, rows)
         
-        df['indicator_name'] = indicator_name
-        
-        cursor = self.conn.cursor()
-        records = df.to_dict('records')
-        
-        for record in records:
-            cursor.execute("""
-                INSERT OR REPLACE INTO economic_indicators 
-                (indicator_name, date, value, yoy_change, mom_change)
-                VALUES (:indicator_name, :date, :value, :yoy_change, :mom_change)
-            """, record)
-        
-        self.conn.commit()
-        console.print(f"[green]✓[/green] Stored {len(df)} records for {indicator_name}")
+        self._indicator_snapshot = None
+        log.info("[green]✓[/green] Stored %d records for %s", len(df), indicator_name)
     
     def get_economic_indicator(self, indicator_name: str, 
                                start_date: Optional[str] = None,
@@ -439,81 +775,76 @@ class Database:
         Returns:
             DataFrame with indicator data
         """
-        query = """
-            SELECT date, value, yoy_change, mom_change
-            FROM economic_indicators
-            WHERE indicator_name = ?
-        """
+        # Date bounds apply after the window so the first rows in range keep their YoY
+        query = f"SELECT date, value, yoy_change, mom_change FROM ({self._SQL_INDICATOR_CHANGES})"
         params = [indicator_name]
+        conditions = []
         
         if start_date:
-            query += " AND date >= ?"
+            conditions.append("date >= ?")
             params.append(start_date)
         
         if end_date:
-            query += " AND date <= ?"
+            conditions.append("date <= ?")
             params.append(end_date)
         
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY date ASC"
         
-        df = pd.read_sql_query(query, self.conn, params=params, parse_dates=['date'])
+        # Plain tuples into typed arrays, as in get_historical_prices (NULL
+        # changes on the first observations become NaN)
+        rows = self.conn.execute(query, params).fetchall()
         
-        if not df.empty:
-            df.set_index('date', inplace=True)
+        if rows:
+            dates, *values = zip(*rows)
+            columns = dict(zip(self._INDICATOR_COLUMNS, np.array(values, dtype=np.float64)))
+            index = pd.DatetimeIndex(np.array(dates, dtype='datetime64[ns]'), name='date')
+            df = pd.DataFrame(columns, index=index)
+        else:
+            df = pd.DataFrame(columns=['date', *self._INDICATOR_COLUMNS]).astype({'date': 'datetime64[ns]'})
         
         return df
     
+    def get_latest_indicators_snapshot(self) -> Dict[str, Dict]:
+        """
+        Get the latest observation of every economic indicator in one query
+        
+        Returns:
+            Dictionary of indicator_name -> {'value', 'yoy_change', 'date'}; reused
+            until indicator data is stored or another connection commits a change
+        """
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._indicator_snapshot is None or version != self._indicator_snapshot_version:
+            rows = self.conn.execute(self._SQL_INDICATOR_SNAPSHOT).fetchall()
+            self._indicator_snapshot = {
+                name: {'value': value, 'yoy_change': yoy_change, 'date': date}
+                for name, value, yoy_change, date in rows
+            }
+            self._indicator_snapshot_version = version
+        
+        return self._indicator_snapshot
+    
+    def _latest_indicator_field(self, indicator_name: str, field: str) -> Optional[float]:
+        """Read one field of an indicator's latest observation from the snapshot"""
+        latest = self.get_latest_indicators_snapshot().get(indicator_name)
+        return latest[field] if latest else None
+    
     def get_latest_m2_growth(self, indicator_name: str = 'M2_US') -> Optional[float]:
         """Get the most recent M2 year-over-year growth rate"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT yoy_change
-            FROM economic_indicators
-            WHERE indicator_name = ? AND yoy_change IS NOT NULL
-            ORDER BY date DESC
-            LIMIT 1
-        """, (indicator_name,))
-        result = cursor.fetchone()
-        return result['yoy_change'] if result else None
+        return self._latest_indicator_field(indicator_name, 'yoy_change')
     
     def get_latest_gdp_growth(self) -> Optional[float]:
         """Get the most recent GDP year-over-year growth rate"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT yoy_change
-            FROM economic_indicators
-            WHERE indicator_name = 'GDP' AND yoy_change IS NOT NULL
-            ORDER BY date DESC
-            LIMIT 1
-        """)
-        result = cursor.fetchone()
-        return result['yoy_change'] if result else None
+        return self._latest_indicator_field('GDP', 'yoy_change')
     
     def get_latest_m2_level(self, indicator_name: str = 'M2_US') -> Optional[float]:
         """Get the most recent M2 money supply level"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT value
-            FROM economic_indicators
-            WHERE indicator_name = ?
-            ORDER BY date DESC
-            LIMIT 1
-        """, (indicator_name,))
-        result = cursor.fetchone()
-        return result['value'] if result else None
+        return self._latest_indicator_field(indicator_name, 'value')
     
     def get_latest_gdp_level(self) -> Optional[float]:
         """Get the most recent GDP level"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT value
-            FROM economic_indicators
-            WHERE indicator_name = 'GDP'
-            ORDER BY date DESC
-            LIMIT 1
-        """)
-        result = cursor.fetchone()
-        return result['value'] if result else None
+        return self._latest_indicator_field('GDP', 'value')
     
     def store_news_article(self, title: str, description: str, source: str,
                           published_at: Optional[datetime], url: str,
@@ -532,20 +863,32 @@ class Database:
             sentiment_label: Sentiment label (positive/negative/neutral)
             related_index: Related index (SP500, CW8, EURUSD, GENERAL)
         """
-        cursor = self.conn.cursor()
-        
-        # Convert datetime to string if needed
-        pub_date_str = published_at.strftime('%Y-%m-%d %H:%M:%S') if published_at else None
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO news_articles
-            (title, description, source, published_at, url, 
-             sentiment_score, sentiment_label, related_index)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (title, description, source, pub_date_str, url,
-              sentiment_score, sentiment_label, related_index))
+        self.store_news_articles([{
+            'title': title, 'description': description, 'source': source,
+            'published_at': published_at, 'url': url, 'sentiment_score': sentiment_score,
+            'sentiment_label': sentiment_label, 'related_index': related_index
+        }])
+    
+    def store_news_articles(self, articles: List[Dict[str, Any]]):
+        """
+        Store several news articles in one transaction
         
-        self.conn.commit()
+        Args:
+            articles: Dicts with the store_news_article() argument names
+        """
+        rows = (
+            (
+                article['title'], article.get('description'), article.get('source'),
+                # Convert datetime to string if needed
+                article['published_at'].strftime('%Y-%m-%d %H:%M:%S') if article.get('published_at') else None,
+                # Missing links are stored as NULL so they never collide on the URL index
+                article.get('url') or None,
+                article.get('sentiment_score'), article.get('sentiment_label'), article.get('related_index')
+            )
+            for article in articles
+        )
+        with self.bulk():
+            self.conn.executemany(self._SQL_INSERT_NEWS, rows)
     
     def get_recent_news(self, days: int = 30, related_index: Optional[str] = None) -> pd.DataFrame:
         """
@@ -558,13 +901,17 @@ class Database:
         Returns:
             DataFrame with news articles
         """
+        # Compare against a precomputed cutoff (UTC, like julianday('now')) so the
+        # filter is a plain range check on the stored timestamp text and can use
+        # idx_news_date instead of evaluating julianday() on every row
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
         query = """
             SELECT title, description, source, published_at, url,
                    sentiment_score, sentiment_label, related_index
             FROM news_articles
-            WHERE julianday('now') - julianday(published_at) <= ?
+            WHERE published_at >= ?
         """
-        params = [days]
+        params = [cutoff]
         
         if related_index:
             query += " AND related_index = ?"
@@ -1,16 +1,20 @@
 """Decision engine for investment recommendations"""
 
-from typing import Dict, Optional, Tuple, List
-from dataclasses import dataclass
-from enum import Enum
+from bisect import bisect_right
+from typing import Dict, NamedTuple, Optional, Tuple, List, Union
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 
 
-class Recommendation(Enum):
-    """Investment recommendation types"""
-    STRONG_BUY = "STRONG_BUY"
-    BUY = "BUY"
-    HOLD = "HOLD"
-    AVOID = "AVOID"
+class Recommendation(IntEnum):
+    """Investment recommendation types, ordered so stronger signals compare higher"""
+    STRONG_BUY = 3
+    BUY = 2
+    HOLD = 1
+    AVOID = 0
 
 
 class RiskTolerance(Enum):
@@ -20,9 +24,152 @@ class RiskTolerance(Enum):
     AGGRESSIVE = "aggressive"
 
 
-@dataclass
+def _above(x: float) -> float:
+    """Smallest float greater than x, the cutoff for a strict '> x' condition"""
+    return float(np.nextafter(x, np.inf))
+
+
+class _Ladder(NamedTuple):
+    """
+    Points awarded for one numeric factor, by bucket
+    
+    Bucket i holds the values v with cutoffs[i-1] <= v < cutoffs[i] (bisect_right
+    / np.searchsorted side='right'). NaN goes to nan_bucket, the bucket whose
+    points the value would get if no threshold matched.
+    """
+    cutoffs: Tuple[float, ...]
+    points: Tuple[int, ...]
+    notes: Tuple[Optional[Tuple[str, str]], ...]  # ('reason' | 'risk', template) per bucket
+    nan_bucket: int
+
+
+_DIP_LADDER = _Ladder(
+    cutoffs=(-7, -5, -3, -1),
+    points=(35, 30, 20, 10, -5),
+    notes=(
+        ('reason', "Major dip: {:.1f}% - excellent entry point"),
+        ('reason', "Significant dip: {:.1f}%"),
+        ('reason', "Moderate dip: {:.1f}%"),
+        ('reason', "Small dip: {:.1f}%"),
+        ('risk', "Near high ({:+.1f}%) - limited upside"),
+    ),
+    nan_bucket=4
+)
+
+_RSI_LADDER = _Ladder(
+    cutoffs=(30, 40, _above(60), _above(70)),
+    points=(25, 15, 0, -10, -20),
+    notes=(
+        ('reason', "Oversold (RSI: {:.0f}) - bounce likely"),
+        ('reason', "Approaching oversold (RSI: {:.0f})"),
+        None,
+        ('risk', "Elevated RSI ({:.0f})"),
+        ('risk', "Overbought (RSI: {:.0f}) - pullback risk"),
+    ),
+    nan_bucket=2
+)
+
+_SENTIMENT_LADDER = _Ladder(
+    cutoffs=(-0.2, -0.05, _above(0.05), _above(0.2)),
+    points=(-20, -10, 0, 10, 20),
+    notes=(
+        ('risk', "Negative sentiment ({:-.2f})"),
+        ('risk', "Slightly negative sentiment ({:-.2f})"),
+        None,
+        ('reason', "Positive sentiment ({:+.2f})"),
+        ('reason', "Strong positive sentiment ({:+.2f})"),
+    ),
+    nan_bucket=2
+)
+
+_RECESSION_LADDER = _Ladder(
+    cutoffs=(0.1, _above(0.3), _above(0.6)),
+    points=(5, 0, -20, -40),
+    notes=(
+        ('reason', "Low recession risk"),
+        None,
+        ('risk', "Moderate recession risk ({:.0%})"),
+        ('risk', "High recession risk ({:.0%})"),
+    ),
+    nan_bucket=1
+)
+
+_AI_BUBBLE_LADDER = _Ladder(
+    cutoffs=(0.2, _above(0.4), _above(0.6)),
+    points=(5, 0, -15, -30),
+    notes=(
+        ('reason', "Low bubble risk"),
+        None,
+        ('risk', "Moderate AI bubble concerns ({:.0%})"),
+        ('risk', "High AI/tech bubble risk ({:.0%})"),
+    ),
+    nan_bucket=1
+)
+
+
+def _apply_ladder(ladder: _Ladder, value: float, notes: Optional[list]) -> int:
+    """Points for one factor value; records the bucket's note as (kind, template, value) if notes is given"""
+    bucket = bisect_right(ladder.cutoffs, value) if value == value else ladder.nan_bucket
+    note = ladder.notes[bucket]
+    if note and notes is not None:
+        notes.append((*note, value))
+    return ladder.points[bucket]
+
+
+def _ladder_points(ladder: _Ladder, values: np.ndarray) -> np.ndarray:
+    """Points of each value in an array (one np.searchsorted per ladder)"""
+    buckets = np.searchsorted(ladder.cutoffs, values, side='right')
+    buckets = np.where(np.isnan(values), ladder.nan_bucket, buckets)
+    return np.asarray(ladder.points)[buckets]
+
+
+class RecommendationResult(NamedTuple):
+    """Outcome of DecisionEngine.generate_recommendation"""
+    recommendation: Recommendation
+    confidence: float
+    score: int
+    reasons: Tuple[str, ...] = ()
+    risk_factors: Tuple[str, ...] = ()
+    risk_tolerance: Optional[str] = None
+
+
+class _RankedScores(NamedTuple):
+    """Best, runner-up and worst entries of a score dict"""
+    best_key: str
+    best: float
+    second_key: Optional[str]
+    second: float
+    worst_key: str
+    worst: float
+
+
+def _rank_scores(scores: Dict[str, int]) -> _RankedScores:
+    """One pass over scores; ties keep dict order, like max() and a stable sort"""
+    best_key = second_key = worst_key = None
+    best = second = -np.inf
+    worst = np.inf
+    for key, value in scores.items():
+        if value > best:
+            second_key, second = best_key, best
+            best_key, best = key, value
+        elif value > second:
+            second_key, second = key, value
+        if value < worst:
+            worst_key, worst = key, value
+    return _RankedScores(best_key, best, second_key, second, worst_key, worst)
+
+
+# Trend labels as bit flags, so up / down membership is a single AND
+_TREND_CODES = {'sideways': 0, 'strong_uptrend': 1, 'uptrend': 2, 'downtrend': 4, 'strong_downtrend': 8}
+_UPTREND_MASK = 0b0011
+_DOWNTREND_MASK = 0b1100
+# Trend labels as shown in reasons / risk factors
+_TREND_DISPLAY = {label: label.replace('_', ' ') for label in _TREND_CODES}
+
+
+@dataclass(frozen=True, eq=True, slots=True)
 class DecisionFactors:
-    """All factors that influence the investment decision"""
+    """All factors that influence the investment decision (immutable, so usable as a cache key)"""
     # Technical factors
     dip_percentage: float
     rsi: float
@@ -56,6 +203,52 @@ class DecisionFactors:
     currency_risk_level: Optional[str] = None
     currency_change_pct: Optional[float] = None
     currency_impact: Optional[str] = None
+    
+    # Derived: trend as a _TREND_CODES flag (0 for unknown labels)
+    trend_code: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'trend_code', _TREND_CODES.get(self.trend, 0))
+
+
+def _sp500_currency_points(factors: DecisionFactors, notes: Optional[list]) -> int:
+    """S&P 500 is held in EUR: score the USD/EUR move"""
+    if not factors.currency_risk_level:
+        return 0
+    if factors.currency_risk_level == 'high':
+        if notes is not None:
+            notes.append((
+                'risk',
+                "⚠️ CURRENCY DRAG: Dollar weakening {:.1f}% significantly reduces EUR returns",
+                factors.currency_change_pct
+            ))
+        return -25
+    if factors.currency_risk_level == 'moderate':
+        if notes is not None:
+            notes.append(('risk', "Currency headwind: Dollar down {:.1f}%", factors.currency_change_pct))
+        return -15
+    if factors.currency_impact == 'positive':
+        if notes is not None:
+            notes.append((
+                'reason', "Currency tailwind: Dollar strengthening {:.1f}%", abs(factors.currency_change_pct)
+            ))
+        return 10
+    return 0
+
+
+def _stoxx600_points(factors: DecisionFactors, notes: Optional[list]) -> int:
+    """BONUS: No currency risk for EUR investors!"""
+    # Phase 6B: STOXX600 uses Eurozone M2 data (not US M2)
+    if notes is not None:
+        notes.append(('reason', "✅ No currency risk (EUR-denominated)", None))
+    return 5
+
+
+# Index-specific adjustments (currency exposure); indices not listed get none
+_INDEX_HANDLERS = {
+    'SP500': _sp500_currency_points,
+    'STOXX600': _stoxx600_points,
+}
 
 
 class DecisionEngine:
@@ -66,6 +259,8 @@ class DecisionEngine:
     
     def __init__(self, risk_tolerance: str = "moderate"):
         self.risk_tolerance = RiskTolerance(risk_tolerance)
+        # Enum .value goes through a descriptor; results carry the plain string
+        self._risk_label = self.risk_tolerance.value
         
         # Score thresholds for each risk tolerance level
         self.thresholds = {
@@ -85,81 +280,139 @@ class DecisionEngine:
                 'hold': 10
             }
         }
+        # Active (strong_buy, buy, hold) cut-offs, read once per recommendation
+        t = self.thresholds[self.risk_tolerance]
+        self._threshold_tuple = (t['strong_buy'], t['buy'], t['hold'])
+        # Same cut-offs ascending: the number of edges a score reaches is its
+        # Recommendation value (AVOID=0 ... STRONG_BUY=3)
+        self._bucket_edges = np.array([t['hold'], t['buy'], t['strong_buy']])
     
     def generate_recommendation(
         self,
         index_name: str,
-        factors: DecisionFactors
-    ) -> Dict:
+        factors: DecisionFactors,
+        verbose: bool = True
+    ) -> RecommendationResult:
         """
         Generate investment recommendation based on all factors
         
         Args:
             index_name: Index name (SP500 or CW8)
             factors: All decision factors
+            verbose: Build the reason / risk factor texts (False for batch
+                     callers that only need the outcome)
             
         Returns:
-            Dictionary with recommendation and details
+            RecommendationResult (reasons and risk factors are empty when
+            verbose is False)
         """
-        score = 0
+        score, reasons, risk_factors = self._cached_score(index_name, factors, verbose)
+        
+        # ============================================================
+        # FINAL RECOMMENDATION
+        # ============================================================
+        strong_buy_at, buy_at, hold_at = self._threshold_tuple
+        
+        # Confidence caps as conditional expressions (no min()/abs() calls)
+        confidence = score / 100
+        if score >= strong_buy_at:
+            recommendation = Recommendation.STRONG_BUY
+            confidence = confidence if confidence < 0.95 else 0.95
+        elif score >= buy_at:
+            recommendation = Recommendation.BUY
+            confidence = confidence if confidence < 0.85 else 0.85
+        elif score >= hold_at:
+            recommendation = Recommendation.HOLD
+            confidence = confidence if confidence < 0.70 else 0.70
+        else:
+            recommendation = Recommendation.AVOID
+            confidence = -confidence if score < 0 else confidence
+            confidence = confidence if confidence < 0.80 else 0.80
+        
+        return RecommendationResult(
+            recommendation, confidence, score, reasons, risk_factors, self._risk_label
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_score(
+        index_name: str,
+        factors: DecisionFactors,
+        verbose: bool
+    ) -> Tuple[int, Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Score plus formatted reasons / risk factors, memoized on the inputs
+        
+        Re-rendering a report on unchanged factors skips the whole pass. The
+        texts are tuples so the cached entry cannot be altered by a caller.
+        """
+        notes = [] if verbose else None
+        score = DecisionEngine._score_factors(index_name, factors, notes)
+        if not verbose:
+            return score, (), ()
+        
+        # Text is only produced here, for the rules that fired
         reasons = []
         risk_factors = []
+        for kind, template, value in notes:
+            (reasons if kind == 'reason' else risk_factors).append(template.format(value))
+        return score, tuple(reasons), tuple(risk_factors)
+    
+    @staticmethod
+    def _score_factors(
+        index_name: str,
+        factors: DecisionFactors,
+        notes: Optional[List[Tuple[str, str, object]]] = None
+    ) -> int:
+        """
+        Numeric scoring pass
+        
+        Args:
+            index_name: Index name
+            factors: All decision factors
+            notes: If given, receives ('reason' | 'risk', template, value) for
+                   each rule that fired, in rule order; formatting is left to
+                   callers that display them
+            
+        Returns:
+            Total score
+        """
+        score = 0
         
         # ============================================================
         # 1. DIP DETECTION (Opportunity Factor)
         # ============================================================
-        if factors.dip_percentage < -7:
-            score += 35
-            reasons.append(f"Major dip: {factors.dip_percentage:.1f}% - excellent entry point")
-        elif factors.dip_percentage < -5:
-            score += 30
-            reasons.append(f"Significant dip: {factors.dip_percentage:.1f}%")
-        elif factors.dip_percentage < -3:
-            score += 20
-            reasons.append(f"Moderate dip: {factors.dip_percentage:.1f}%")
-        elif factors.dip_percentage < -1:
-            score += 10
-            reasons.append(f"Small dip: {factors.dip_percentage:.1f}%")
-        else:
-            score -= 5
-            risk_factors.append(f"Near high ({factors.dip_percentage:+.1f}%) - limited upside")
+        score += _apply_ladder(_DIP_LADDER, factors.dip_percentage, notes)
         
         # ============================================================
         # 2. RSI - MOMENTUM INDICATOR
         # ============================================================
-        if factors.rsi < 30:
-            score += 25
-            reasons.append(f"Oversold (RSI: {factors.rsi:.0f}) - bounce likely")
-        elif factors.rsi < 40:
-            score += 15
-            reasons.append(f"Approaching oversold (RSI: {factors.rsi:.0f})")
-        elif factors.rsi > 70:
-            score -= 20
-            risk_factors.append(f"Overbought (RSI: {factors.rsi:.0f}) - pullback risk")
-        elif factors.rsi > 60:
-            score -= 10
-            risk_factors.append(f"Elevated RSI ({factors.rsi:.0f})")
+        score += _apply_ladder(_RSI_LADDER, factors.rsi, notes)
         
         # ============================================================
         # 3. TREND ANALYSIS
         # ============================================================
-        if factors.trend in ['strong_uptrend', 'uptrend']:
+        if factors.trend_code & _UPTREND_MASK:
             score += 10
-            reasons.append(f"Trend: {factors.trend.replace('_', ' ')}")
-        elif factors.trend in ['strong_downtrend', 'downtrend']:
+            if notes is not None:
+                notes.append(('reason', "Trend: {}", _TREND_DISPLAY[factors.trend]))
+        elif factors.trend_code & _DOWNTREND_MASK:
             score -= 15
-            risk_factors.append(f"Trend: {factors.trend.replace('_', ' ')}")
+            if notes is not None:
+                notes.append(('risk', "Trend: {}", _TREND_DISPLAY[factors.trend]))
         
         if factors.golden_cross:
             score += 5
-            reasons.append("Golden cross (bullish)")
+            if notes is not None:
+                notes.append(('reason', "Golden cross (bullish)", None))
         
         # ============================================================
         # 4. MACD
         # ============================================================
         if factors.macd_bullish:
             score += 10
-            reasons.append("MACD bullish crossover")
+            if notes is not None:
+                notes.append(('reason', "MACD bullish crossover", None))
         else:
             score -= 5
         
@@ -170,136 +423,213 @@ class DecisionEngine:
             # Add M2 score directly
             score += factors.m2_score
             
-            if factors.m2_score >= 20:
-                reasons.append(f"💵 Strong M2 expansion (+{factors.m2_yoy_growth:.1f}% YoY) - very supportive")
-            elif factors.m2_score >= 10:
-                reasons.append(f"💵 M2 expanding (+{factors.m2_yoy_growth:.1f}% YoY) - supportive")
-            elif factors.m2_score <= -15:
-                risk_factors.append(f"💵 M2 contracting ({factors.m2_yoy_growth:.1f}% YoY) - liquidity headwind")
-            else:
-                # Neutral M2
-                pass
-        else:
-            risk_factors.append("M2 data not available")
+            if notes is not None:
+                if factors.m2_score >= 20:
+                    notes.append(('reason', "💵 Strong M2 expansion (+{:.1f}% YoY) - very supportive", factors.m2_yoy_growth))
+                elif factors.m2_score >= 10:
+                    notes.append(('reason', "💵 M2 expanding (+{:.1f}% YoY) - supportive", factors.m2_yoy_growth))
+                elif factors.m2_score <= -15:
+                    notes.append(('risk', "💵 M2 contracting ({:.1f}% YoY) - liquidity headwind", factors.m2_yoy_growth))
+                else:
+                    # Neutral M2
+                    pass
+        elif notes is not None:
+            notes.append(('risk', "M2 data not available", None))
         
         # ============================================================
         # 6. SENTIMENT ANALYSIS
         # ============================================================
-        if factors.overall_sentiment > 0.2:
-            score += 20
-            reasons.append(f"Strong positive sentiment ({factors.overall_sentiment:+.2f})")
-        elif factors.overall_sentiment > 0.05:
-            score += 10
-            reasons.append(f"Positive sentiment ({factors.overall_sentiment:+.2f})")
-        elif factors.overall_sentiment < -0.2:
-            score -= 20
-            risk_factors.append(f"Negative sentiment ({factors.overall_sentiment:-.2f})")
-        elif factors.overall_sentiment < -0.05:
-            score -= 10
-            risk_factors.append(f"Slightly negative sentiment ({factors.overall_sentiment:-.2f})")
+        score += _apply_ladder(_SENTIMENT_LADDER, factors.overall_sentiment, notes)
         
         # Market tone
         if factors.market_tone == 'bullish' and factors.bullish_ratio > 0.25:
             score += 10
-            reasons.append(f"Bullish market tone ({factors.bullish_ratio:.0%} bullish articles)")
+            if notes is not None:
+                notes.append(('reason', "Bullish market tone ({:.0%} bullish articles)", factors.bullish_ratio))
         elif factors.market_tone == 'bearish':
             score -= 15
-            risk_factors.append(f"Bearish market tone")
+            if notes is not None:
+                notes.append(('risk', "Bearish market tone", None))
         
         # ============================================================
         # 7. RECESSION PROBABILITY
         # ============================================================
-        if factors.recession_probability > 0.6:
-            score -= 40
-            risk_factors.append(f"High recession risk ({factors.recession_probability:.0%})")
-        elif factors.recession_probability > 0.3:
-            score -= 20
-            risk_factors.append(f"Moderate recession risk ({factors.recession_probability:.0%})")
-        elif factors.recession_probability < 0.1:
-            score += 5
-            reasons.append("Low recession risk")
+        score += _apply_ladder(_RECESSION_LADDER, factors.recession_probability, notes)
         
         # ============================================================
         # 8. AI BUBBLE RISK
         # ============================================================
-        if factors.ai_bubble_risk > 0.6:
-            score -= 30
-            risk_factors.append(f"High AI/tech bubble risk ({factors.ai_bubble_risk:.0%})")
-        elif factors.ai_bubble_risk > 0.4:
-            score -= 15
-            risk_factors.append(f"Moderate AI bubble concerns ({factors.ai_bubble_risk:.0%})")
-        elif factors.ai_bubble_risk < 0.2:
-            score += 5
-            reasons.append("Low bubble risk")
+        score += _apply_ladder(_AI_BUBBLE_LADDER, factors.ai_bubble_risk, notes)
         
         # ============================================================
         # 9. VOLATILITY
         # ============================================================
         if factors.volatility_level == 'high':
             score -= 10
-            risk_factors.append("High volatility")
+            if notes is not None:
+                notes.append(('risk', "High volatility", None))
         elif factors.volatility_level == 'low':
             score += 5
-            reasons.append("Low volatility")
+            if notes is not None:
+                notes.append(('reason', "Low volatility", None))
         
         # ============================================================
         # 10. CURRENCY RISK (for S&P 500 in EUR terms)
         # ============================================================
-        if index_name == 'SP500' and factors.currency_risk_level:
-            if factors.currency_risk_level == 'high':
-                score -= 25
-                risk_factors.append(
-                    f"⚠️ CURRENCY DRAG: Dollar weakening {factors.currency_change_pct:.1f}% "
-                    f"significantly reduces EUR returns"
-                )
-            elif factors.currency_risk_level == 'moderate':
-                score -= 15
-                risk_factors.append(
-                    f"Currency headwind: Dollar down {factors.currency_change_pct:.1f}%"
-                )
-            elif factors.currency_impact == 'positive':
-                score += 10
-                reasons.append(
-                    f"Currency tailwind: Dollar strengthening {abs(factors.currency_change_pct):.1f}%"
-                )
-        elif index_name == 'STOXX600':
-            # BONUS: No currency risk for EUR investors!
-            score += 5
-            reasons.append("✅ No currency risk (EUR-denominated)")
-            # Phase 6B: STOXX600 uses Eurozone M2 data (not US M2)
+        index_handler = _INDEX_HANDLERS.get(index_name)
+        if index_handler is not None:
+            score += index_handler(factors, notes)
         
-        # ============================================================
-        # FINAL RECOMMENDATION
-        # ============================================================
-        thresholds = self.thresholds[self.risk_tolerance]
+        return score
+    
+    def score_many(self, index_name: str, factors_list: List[DecisionFactors]) -> np.ndarray:
+        """
+        Score many factor sets for one index at once (e.g. one per backtest date)
         
-        if score >= thresholds['strong_buy']:
-            recommendation = Recommendation.STRONG_BUY
-            confidence = min(score / 100, 0.95)
-        elif score >= thresholds['buy']:
-            recommendation = Recommendation.BUY
-            confidence = min(score / 100, 0.85)
-        elif score >= thresholds['hold']:
-            recommendation = Recommendation.HOLD
-            confidence = min(score / 100, 0.70)
+        Gives the same scores as generate_recommendation without building the
+        reason strings; use generate_recommendation for the set being reported.
+        
+        Args:
+            index_name: Index name (SP500, CW8 or STOXX600)
+            factors_list: Decision factors, one per evaluation
+            
+        Returns:
+            Integer array of scores, in the order of factors_list
+        """
+        def column(field, dtype=float):
+            return np.array([getattr(f, field) for f in factors_list], dtype=dtype)
+        
+        def labels(field):
+            return np.array([getattr(f, field) or '' for f in factors_list], dtype=str)
+        
+        return self._score_vectorized(
+            dip=column('dip_percentage'), rsi=column('rsi'), trend_code=column('trend_code', np.int64),
+            golden_cross=column('golden_cross', bool), macd_bullish=column('macd_bullish', bool),
+            m2_yoy=column('m2_yoy_growth'), m2_score=column('m2_score', np.int64),
+            sentiment=column('overall_sentiment'), market_tone=labels('market_tone'),
+            bullish_ratio=column('bullish_ratio'), recession=column('recession_probability'),
+            ai_bubble=column('ai_bubble_risk'), volatility=labels('volatility_level'),
+            is_sp500=index_name == 'SP500', is_stoxx600=index_name == 'STOXX600',
+            currency_level=labels('currency_risk_level'), currency_impact=labels('currency_impact')
+        )
+    
+    def classify_scores(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Bucket scores into recommendations with one np.searchsorted call
+        
+        Args:
+            scores: Scores, e.g. from score_many
+            
+        Returns:
+            Integer array of Recommendation values (Recommendation(code) for the member)
+        """
+        return np.searchsorted(self._bucket_edges, scores, side='right')
+    
+    def generate_recommendations_batch(
+        self,
+        factors_df: Union[pd.DataFrame, np.ndarray],
+        index_name: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Recommendations for many factor sets in one NumPy pass
+        
+        Each column is scored as a whole vector, so the cost is per rule rather
+        than per row. Reason texts are not built; call generate_recommendation
+        for the rows that need a detailed report.
+        
+        Args:
+            factors_df: One row per factor set, columns named like the
+                        DecisionFactors fields (a structured array also works)
+            index_name: Index for every row; if None, an 'index_name' column is used
+            
+        Returns:
+            DataFrame on the same index with recommendation, confidence and score
+        """
+        if isinstance(factors_df, np.ndarray):
+            factors_df = pd.DataFrame(factors_df)
+        
+        def column(field, dtype=float):
+            if field not in factors_df:
+                return np.full(len(factors_df), np.nan if dtype is float else 0, dtype=dtype)
+            return factors_df[field].to_numpy(dtype=dtype, na_value=np.nan if dtype is float else 0)
+        
+        def labels(field):
+            if field not in factors_df:
+                return np.full(len(factors_df), '')
+            return factors_df[field].fillna('').to_numpy(dtype=str)
+        
+        if index_name is None:
+            index_names = labels('index_name')
+            is_sp500, is_stoxx600 = index_names == 'SP500', index_names == 'STOXX600'
         else:
-            recommendation = Recommendation.AVOID
-            confidence = min(abs(score) / 100, 0.80)
+            is_sp500, is_stoxx600 = index_name == 'SP500', index_name == 'STOXX600'
         
-        return {
-            'recommendation': recommendation,
+        scores = self._score_vectorized(
+            dip=column('dip_percentage'), rsi=column('rsi'),
+            trend_code=np.fromiter(
+                (_TREND_CODES.get(label, 0) for label in labels('trend')), dtype=np.int64, count=len(factors_df)
+            ),
+            golden_cross=column('golden_cross', bool), macd_bullish=column('macd_bullish', bool),
+            m2_yoy=column('m2_yoy_growth'), m2_score=column('m2_score', np.int64),
+            sentiment=column('overall_sentiment'), market_tone=labels('market_tone'),
+            bullish_ratio=column('bullish_ratio'), recession=column('recession_probability'),
+            ai_bubble=column('ai_bubble_risk'), volatility=labels('volatility_level'),
+            is_sp500=is_sp500, is_stoxx600=is_stoxx600,
+            currency_level=labels('currency_risk_level'), currency_impact=labels('currency_impact')
+        )
+        codes = self.classify_scores(scores)
+        # Confidence caps indexed by Recommendation value (AVOID ... STRONG_BUY);
+        # AVOID is scored on the magnitude of its (negative) score
+        caps = np.array([0.80, 0.70, 0.85, 0.95])[codes]
+        confidence = np.minimum(np.where(codes == Recommendation.AVOID, np.abs(scores), scores) / 100, caps)
+        
+        return pd.DataFrame({
+            # object dtype keeps the Recommendation members (pandas would store plain ints)
+            'recommendation': pd.Series([Recommendation(code) for code in codes], index=factors_df.index, dtype=object),
             'confidence': confidence,
-            'score': score,
-            'reasons': reasons,
-            'risk_factors': risk_factors,
-            'risk_tolerance': self.risk_tolerance.value
-        }
+            'score': scores
+        }, index=factors_df.index)
+    
+    @staticmethod
+    def _score_vectorized(dip, rsi, trend_code, golden_cross, macd_bullish, m2_yoy, m2_score,
+                          sentiment, market_tone, bullish_ratio, recession, ai_bubble,
+                          volatility, is_sp500, is_stoxx600, currency_level, currency_impact) -> np.ndarray:
+        """
+        Branch-free scoring kernel: each if/elif ladder of generate_recommendation
+        becomes one np.select (first matching condition wins, like elif).
+        Missing labels are '', a missing M2 reading is NaN and trends are
+        _TREND_CODES flags.
+        """
+        score = _ladder_points(_DIP_LADDER, dip)
+        score += _ladder_points(_RSI_LADDER, rsi)
+        score += np.select(
+            [(trend_code & _UPTREND_MASK) != 0, (trend_code & _DOWNTREND_MASK) != 0],
+            [10, -15], default=0
+        )
+        score += np.where(golden_cross, 5, 0)
+        score += np.where(macd_bullish, 10, -5)
+        score += np.where(np.isnan(m2_yoy), 0, m2_score)
+        score += _ladder_points(_SENTIMENT_LADDER, sentiment)
+        score += np.select(
+            [(market_tone == 'bullish') & (bullish_ratio > 0.25), market_tone == 'bearish'],
+            [10, -15], default=0
+        )
+        score += _ladder_points(_RECESSION_LADDER, recession)
+        score += _ladder_points(_AI_BUBBLE_LADDER, ai_bubble)
+        score += np.select([volatility == 'high', volatility == 'low'], [-10, 5], default=0)
+        has_currency = is_sp500 & (currency_level != '')
+        score += np.select(
+            [has_currency & (currency_level == 'high'), has_currency & (currency_level == 'moderate'),
+             has_currency & (currency_impact == 'positive'), np.full(len(dip), is_stoxx600)],
+            [-25, -15, 10, 5], default=0
+        )
+        return score
     
     def compare_recommendations(
         self,
-        sp500_result: Dict,
-        cw8_result: Dict,
-        stoxx600_result: Optional[Dict] = None
+        sp500_result: RecommendationResult,
+        cw8_result: RecommendationResult,
+        stoxx600_result: Optional[RecommendationResult] = None
     ) -> Dict:
         """
         Compare recommendations to provide overall advice
@@ -315,17 +645,18 @@ class DecisionEngine:
         """
         # Collect scores
         scores = {
-            'sp500': sp500_result['score'],
-            'cw8': cw8_result['score']
+            'sp500': sp500_result.score,
+            'cw8': cw8_result.score
         }
         
         if stoxx600_result:
-            scores['stoxx600'] = stoxx600_result['score']
+            scores['stoxx600'] = stoxx600_result.score
         
         # Find best option
-        best_index = max(scores, key=scores.get)
-        best_score = scores[best_index]
-        worst_score = min(scores.values())
+        ranked = _rank_scores(scores)
+        best_index = ranked.best_key
+        best_score = ranked.best
+        worst_score = ranked.worst
         
         # Determine preference message
         if stoxx600_result:
@@ -360,8 +691,9 @@ class DecisionEngine:
         if stoxx600_result:
             results.append(stoxx600_result)
         
-        buy_count = sum(1 for r in results if r['recommendation'] in [Recommendation.STRONG_BUY, Recommendation.BUY])
-        hold_count = sum(1 for r in results if r['recommendation'] == Recommendation.HOLD)
+        recs = [r.recommendation for r in results]
+        buy_count = recs.count(Recommendation.STRONG_BUY) + recs.count(Recommendation.BUY)
+        hold_count = recs.count(Recommendation.HOLD)
         
         if buy_count >= 2:
             overall = "INVEST"
@@ -386,6 +718,7 @@ class DecisionEngine:
         # Generate diversification suggestions
         diversification = self._generate_diversification_suggestions(
             scores, 
+            ranked, 
             preference, 
             stoxx600_result is not None
         )
@@ -406,6 +739,7 @@ class DecisionEngine:
     def _generate_diversification_suggestions(
         self, 
         scores: Dict[str, int], 
+        ranked: _RankedScores,
         preference: str,
         has_stoxx600: bool
     ) -> Dict:
@@ -414,6 +748,7 @@ class DecisionEngine:
         
         Args:
             scores: Dictionary of index scores
+            ranked: _rank_scores(scores)
             preference: Preferred index or 'multiple'
             has_stoxx600: Whether STOXX600 is analyzed
             
@@ -426,16 +761,19 @@ class DecisionEngine:
             # 2-way allocation (SP500 vs CW8)
             total = scores['sp500'] + scores['cw8']
             if total > 0:
-                sp500_pct = max(0, min(100, int((scores['sp500'] / total) * 100)))
+                # Clamps are inline conditionals rather than max()/min() calls
+                sp500_pct = int((scores['sp500'] / total) * 100)
+                sp500_pct = 0 if sp500_pct < 0 else 100 if sp500_pct > 100 else sp500_pct
                 cw8_pct = 100 - sp500_pct
             else:
                 sp500_pct = 50
                 cw8_pct = 50
             
+            conservative_sp500 = sp500_pct if sp500_pct < 40 else 40
             allocations = {
                 'conservative': {
-                    'sp500': min(sp500_pct, 40),
-                    'cw8': 100 - min(sp500_pct, 40),
+                    'sp500': conservative_sp500,
+                    'cw8': 100 - conservative_sp500,
                     'description': 'Lower risk, favor global diversification'
                 },
                 'moderate': {
@@ -444,8 +782,8 @@ class DecisionEngine:
                     'description': 'Balanced allocation based on current scores'
                 },
                 'aggressive': {
-                    'sp500': min(sp500_pct + 10, 70),
-                    'cw8': max(cw8_pct - 10, 30),
+                    'sp500': sp500_pct + 10 if sp500_pct < 60 else 70,
+                    'cw8': cw8_pct - 10 if cw8_pct > 40 else 30,
                     'description': 'Higher concentration in best performer'
                 }
             }
@@ -454,8 +792,10 @@ class DecisionEngine:
             total = scores['sp500'] + scores['cw8'] + scores['stoxx600']
             
             if total > 0:
-                sp500_base = max(0, int((scores['sp500'] / total) * 100))
-                cw8_base = max(0, int((scores['cw8'] / total) * 100))
+                sp500_base = int((scores['sp500'] / total) * 100)
+                sp500_base = sp500_base if sp500_base > 0 else 0
+                cw8_base = int((scores['cw8'] / total) * 100)
+                cw8_base = cw8_base if cw8_base > 0 else 0
                 stoxx_base = 100 - sp500_base - cw8_base  # Ensure 100% total
             else:
                 sp500_base = 33
@@ -463,15 +803,14 @@ class DecisionEngine:
                 stoxx_base = 34
             
             # Conservative: Favor STOXX600 (no currency risk), balanced otherwise
+            conservative_sp500 = 10 if sp500_base < 10 else 30 if sp500_base > 30 else sp500_base
+            conservative_cw8 = 20 if cw8_base < 20 else 40 if cw8_base > 40 else cw8_base
             allocations['conservative'] = {
-                'sp500': max(10, min(sp500_base, 30)),
-                'cw8': max(20, min(cw8_base, 40)),
-                'stoxx600': None,  # Calculate remainder
+                'sp500': conservative_sp500,
+                'cw8': conservative_cw8,
+                'stoxx600': 100 - conservative_sp500 - conservative_cw8,  # Remainder
                 'description': 'EUR investor focus: Favor European exposure, no currency risk'
             }
-            allocations['conservative']['stoxx600'] = (
-                100 - allocations['conservative']['sp500'] - allocations['conservative']['cw8']
-            )
             
             # Moderate: Score-based allocation
             allocations['moderate'] = {
@@ -482,23 +821,8 @@ class DecisionEngine:
             }
             
             # Aggressive: Concentrate in top 2 performers
-            sorted_indices = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-            best = sorted_indices[0][0]
-            second = sorted_indices[1][0]
-            
-            if best == 'sp500':
-                best_key = 'sp500'
-            elif best == 'cw8':
-                best_key = 'cw8'
-            else:
-                best_key = 'stoxx600'
-            
-            if second == 'sp500':
-                second_key = 'sp500'
-            elif second == 'cw8':
-                second_key = 'cw8'
-            else:
-                second_key = 'stoxx600'
+            best = ranked.best_key
+            second = ranked.second_key
             
             allocations['aggressive'] = {
                 'sp500': 0,
@@ -506,8 +830,8 @@ class DecisionEngine:
                 'stoxx600': 0,
                 'description': f'Concentrated in best performers: {best.upper()} and {second.upper()}'
             }
-            allocations['aggressive'][best_key] = 60
-            allocations['aggressive'][second_key] = 40
+            allocations['aggressive'][best] = 60
+            allocations['aggressive'][second] = 40
         
         # Add investment rationale
         if has_stoxx600:
@@ -542,5 +866,5 @@ class DecisionEngine:
         return {
             'allocations': allocations,
             'rationale': rationale,
-            'recommended_profile': self.risk_tolerance.value
+            'recommended_profile': self._risk_label
         }
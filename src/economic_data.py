@@ -1,15 +1,58 @@
 """Economic data collection from FRED (Federal Reserve Economic Data)"""
 
+import os
 import requests
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from email.utils import formatdate
+from pathlib import Path
+from typing import Optional, Dict, List
+import numpy as np
 import pandas as pd
 from rich.console import Console
 
-from src.config import FRED_API_KEY, FRED_API_URL, ECONOMIC_INDICATORS, HISTORICAL_YEARS
+from src.config import FRED_API_KEY, FRED_API_URL, FRED_CACHE_DIR, ECONOMIC_INDICATORS, HISTORICAL_YEARS
 
 console = Console()
 
+# YoY growth cut-offs shared by the M2 trend label and favorability. The
+# bucket is the number of cut-offs the growth is strictly above (bisect_left);
+# NaN lands in bucket 0, as it fell through every '>' test before.
+_M2_GROWTH_CUTOFFS = (-2, 2, 5)
+_M2_TRENDS = ('contraction', 'stable', 'expansion', 'strong_expansion')
+# (is_favorable, score, message template, impact) per bucket
+_M2_FAVORABILITY = (
+    (False, -15, 'M2 contracting ({:.1f}% YoY) - headwind for assets', 'negative'),
+    (None, 0, 'M2 stable ({:+.1f}% YoY) - neutral environment', 'neutral'),
+    (True, 10, 'M2 expanding (+{:.1f}% YoY) moderately supports investment', 'positive'),
+    (True, 20, 'Strong M2 expansion (+{:.1f}% YoY) supports asset prices', 'strongly_positive'),
+)
+
+
+def _fred_value(value: str) -> float:
+    """FRED marks missing observations with '.'"""
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+
+def _observations_to_frame(observations: List[Dict]) -> pd.DataFrame:
+    """
+    FRED observations to a DataFrame indexed by date with a float 'value' column
+    
+    Only date and value are read (straight into typed arrays); rows with a
+    missing value are dropped.
+    """
+    count = len(observations)
+    dates = np.fromiter((obs['date'] for obs in observations), dtype='datetime64[D]', count=count)
+    values = np.fromiter((_fred_value(obs['value']) for obs in observations), dtype=np.float64, count=count)
+    present = ~np.isnan(values)
+    return pd.DataFrame({'value': values[present]}, index=pd.DatetimeIndex(dates[present], name='date'))
+
 
 class EconomicDataCollector:
     """Collects economic indicators from FRED API"""
@@ -18,11 +61,28 @@ class EconomicDataCollector:
         self.api_key = api_key
         self.base_url = FRED_API_URL
         self.indicators = ECONOMIC_INDICATORS
+        self.cache_dir = Path(FRED_CACHE_DIR)
+        
+        # One keep-alive session for all FRED calls; transient errors are retried
+        self.session = requests.Session()
+        self.session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
         
         if not self.api_key:
             console.print("[yellow]⚠[/yellow] FRED API key not configured.")
             console.print("[dim]Get a free API key at: https://fred.stlouisfed.org/docs/api/api_key.html[/dim]")
     
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def fetch_m2_data(self, years: int = HISTORICAL_YEARS, region: str = "US") -> pd.DataFrame:
         """
         Fetch M2 Money Supply data from FRED
@@ -58,8 +118,23 @@ class EconomicDataCollector:
             'observation_end': end_date.strftime('%Y-%m-%d')
         }
         
+        # Last download of this series / window; FRED revises monthly, so ask
+        # whether it changed since then rather than downloading it again
+        cache_file = self.cache_dir / f"{series_id}_{years}y.pkl"
+        headers = {}
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            cached = pd.read_pickle(cache_file)
+            headers['If-Modified-Since'] = formatdate(cache_file.stat().st_mtime, usegmt=True)
+        except Exception:  # missing, truncated or otherwise unreadable
+            cached = None
+        
+        try:
+            response = self.session.get(self.base_url, params=params, headers=headers, timeout=30)
+            
+            if cached is not None and response.status_code == 304:
+                console.print(f"[green]✓[/green] {region} M2 unchanged on FRED ({len(cached)} cached observations)")
+                return cached
+            
             response.raise_for_status()
             
             data = response.json()
@@ -68,18 +143,18 @@ class EconomicDataCollector:
                 console.print(f"[red]✗[/red] No {region} M2 data returned from FRED")
                 return pd.DataFrame()
             
-            observations = data['observations']
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(observations)
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
+            # Convert to DataFrame (rows with missing values dropped)
+            df = _observations_to_frame(data['observations'])
             
-            # Remove any rows with missing values
-            df = df.dropna(subset=['value'])
-            
-            # Set date as index
-            df = df.set_index('date')[['value']]
+            if not df.empty:
+                try:
+                    # Written aside and renamed so an interrupted run never leaves a partial file
+                    self.cache_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                    df.to_pickle(tmp_file)
+                    os.replace(tmp_file, cache_file)
+                except OSError:
+                    pass
             
             console.print(f"[green]✓[/green] Fetched {len(df)} {region} M2 observations")
             
@@ -92,6 +167,20 @@ class EconomicDataCollector:
             console.print(f"[red]✗[/red] Unexpected error: {str(e)}")
             return pd.DataFrame()
     
+    def fetch_m2_data_all(self, years: int = HISTORICAL_YEARS) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch US and Eurozone M2 concurrently (independent FRED requests on the shared session)
+        
+        Args:
+            years: Number of years of historical data
+        
+        Returns:
+            Dictionary of region ('US', 'EUROZONE') to fetch_m2_data result
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {region: executor.submit(self.fetch_m2_data, years, region) for region in ('US', 'EUROZONE')}
+            return {region: future.result() for region, future in futures.items()}
+    
     def update_m2_data(self, last_date: str, region: str = "US") -> Optional[pd.DataFrame]:
         """
         Fetch M2 data since last update
@@ -129,7 +218,7 @@ class EconomicDataCollector:
                 'observation_end': end_date.strftime('%Y-%m-%d')
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -138,12 +227,7 @@ class EconomicDataCollector:
                 console.print(f"[blue]ℹ[/blue] No new {region} M2 data available")
                 return None
             
-            observations = data['observations']
-            df = pd.DataFrame(observations)
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
-            df = df.dropna(subset=['value'])
-            df = df.set_index('date')[['value']]
+            df = _observations_to_frame(data['observations'])
             
             if not df.empty:
                 console.print(f"[green]✓[/green] {region} M2 updated to {df.index[-1].strftime('%Y-%m-%d')}")
@@ -174,32 +258,28 @@ class EconomicDataCollector:
                 'trend': 'unknown'
             }
         
-        current_value = m2_data['value'].iloc[-1]
+        # Plain ndarray indexing for the three lookups (no .iloc machinery)
+        values = m2_data['value'].to_numpy()
+        count = values.size
+        current_value = values[-1]
         
         # Year-over-year growth
-        if len(m2_data) >= months_back:
-            past_value = m2_data['value'].iloc[-months_back]
+        if count >= months_back:
+            past_value = values[-months_back]
             yoy_growth = ((current_value - past_value) / past_value) * 100
         else:
             yoy_growth = None
         
         # Month-over-month growth (last available)
-        if len(m2_data) >= 2:
-            prev_value = m2_data['value'].iloc[-2]
+        if count >= 2:
+            prev_value = values[-2]
             mom_growth = ((current_value - prev_value) / prev_value) * 100
         else:
             mom_growth = None
         
         # Determine trend
         if yoy_growth is not None:
-            if yoy_growth > 5:
-                trend = 'strong_expansion'
-            elif yoy_growth > 2:
-                trend = 'expansion'
-            elif yoy_growth > -2:
-                trend = 'stable'
-            else:
-                trend = 'contraction'
+            trend = _M2_TRENDS[bisect_left(_M2_GROWTH_CUTOFFS, yoy_growth)]
         else:
             trend = 'unknown'
         
@@ -228,31 +308,10 @@ class EconomicDataCollector:
                 'impact': 'neutral'
             }
         
-        if yoy_growth > 5:
-            return {
-                'is_favorable': True,
-                'score': 20,
-                'message': f'Strong M2 expansion (+{yoy_growth:.1f}% YoY) supports asset prices',
-                'impact': 'strongly_positive'
-            }
-        elif yoy_growth > 2:
-            return {
-                'is_favorable': True,
-                'score': 10,
-                'message': f'M2 expanding (+{yoy_growth:.1f}% YoY) moderately supports investment',
-                'impact': 'positive'
-            }
-        elif yoy_growth > -2:
-            return {
-                'is_favorable': None,
-                'score': 0,
-                'message': f'M2 stable ({yoy_growth:+.1f}% YoY) - neutral environment',
-                'impact': 'neutral'
-            }
-        else:
-            return {
-                'is_favorable': False,
-                'score': -15,
-                'message': f'M2 contracting ({yoy_growth:.1f}% YoY) - headwind for assets',
-                'impact': 'negative'
-            }
+        is_favorable, score, message, impact = _M2_FAVORABILITY[bisect_left(_M2_GROWTH_CUTOFFS, yoy_growth)]
+        return {
+            'is_favorable': is_favorable,
+            'score': score,
+            'message': message.format(yoy_growth),
+            'impact': impact
+        }
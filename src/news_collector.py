@@ -2,16 +2,54 @@
 
 import feedparser
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional
 from urllib.parse import quote
-import time
 from rich.console import Console
 
 from src.config import NEWS_LOOKBACK_DAYS
 
 console = Console()
 
+_GOOGLE_NEWS_URL = "https://news.google.com/rss/search?q={}&hl=en-US&gl=US&ceid=US:en"
+_YAHOO_FINANCE_RSS_URL = "https://finance.yahoo.com/news/rssindex"
+
+
+@dataclass(slots=True)
+class Article:
+    """A news article; category and sentiment fields are filled in later in the pipeline"""
+    title: str
+    description: str
+    url: str
+    published_at: Optional[datetime]
+    source: str
+    query: str
+    category: str = ''
+    sentiment_score: float = 0
+    sentiment_label: str = 'neutral'
+    sentiment_positive: float = 0.0
+    sentiment_negative: float = 0.0
+
+
+# (category, label, Google News query or None for the Yahoo Finance feed, max results)
+_NEWS_FEEDS = (
+    ('sp500', "S&P 500 news", "S&P 500 stock market", 30),
+    ('cw8', "MSCI World news", "MSCI World index global stocks", 25),
+    ('stoxx600', "STOXX 600 European news", "STOXX 600 European stocks Europe equity market", 25),
+    ('market_general', "general market news", None, 30),
+    ('recession', "recession news", "recession economy unemployment GDP", 20),
+    ('ai_bubble', "AI sector news", "AI artificial intelligence bubble tech stocks valuation", 20),
+    ('fed_policy', "Federal Reserve news", "Federal Reserve Fed interest rates policy", 20),
+    ('ecb_policy', "ECB news", "European Central Bank ECB euro policy", 15),
+    ('dollar_eur', "currency news", "dollar euro EUR/USD exchange rate currency", 20),
+    ('m2_liquidity', "liquidity news", "money supply liquidity M2 monetary policy", 20),
+)
+# Feeds fetched at once; caps concurrent requests in place of a per-request delay
+_NEWS_FETCH_WORKERS = 4
+
 
 class NewsCollector:
     """Collect news from various free sources"""
@@ -19,8 +57,30 @@ class NewsCollector:
     def __init__(self, lookback_days: int = None):
         self.lookback_days = lookback_days or NEWS_LOOKBACK_DAYS
         self.cutoff_date = datetime.now() - timedelta(days=self.lookback_days)
+        
+        # One keep-alive session (gzip) for all feeds; each URL is downloaded
+        # and parsed at most once per collector
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        self._fetch_feed = lru_cache(maxsize=64)(self._download_feed)
     
-    def fetch_google_news(self, query: str, max_results: int = 20) -> List[Dict]:
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _download_feed(self, url: str) -> feedparser.FeedParserDict:
+        """Download an RSS feed over the shared session and parse it"""
+        response = self.session.get(url, timeout=15)
+        response.raise_for_status()
+        return feedparser.parse(response.content)
+    
+    def fetch_google_news(self, query: str, max_results: int = 20) -> List[Article]:
         """
         Fetch news from Google News RSS feed
         
@@ -35,11 +95,10 @@ class NewsCollector:
         
         try:
             # Google News RSS URL
-            encoded_query = quote(query)
-            url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
+            url = _GOOGLE_NEWS_URL.format(quote(query))
             
             # Parse feed
-            feed = feedparser.parse(url)
+            feed = self._fetch_feed(url)
             
             for entry in feed.entries[:max_results]:
                 try:
@@ -52,29 +111,26 @@ class NewsCollector:
                     if pub_date and pub_date < self.cutoff_date:
                         continue
                     
-                    article = {
-                        'title': entry.get('title', ''),
-                        'description': entry.get('summary', ''),
-                        'url': entry.get('link', ''),
-                        'published_at': pub_date,
-                        'source': 'Google News',
-                        'query': query
-                    }
+                    article = Article(
+                        title=entry.get('title', ''),
+                        description=entry.get('summary', ''),
+                        url=entry.get('link', ''),
+                        published_at=pub_date,
+                        source='Google News',
+                        query=query
+                    )
                     articles.append(article)
                     
                 except Exception as e:
                     console.print(f"[dim]Error parsing article: {str(e)}[/dim]")
                     continue
             
-            # Small delay to be respectful
-            time.sleep(0.5)
-            
         except Exception as e:
             console.print(f"[yellow]Warning:[/yellow] Could not fetch Google News for '{query}': {str(e)}")
         
         return articles
     
-    def fetch_yahoo_finance_rss(self, max_results: int = 20) -> List[Dict]:
+    def fetch_yahoo_finance_rss(self, max_results: int = 20) -> List[Article]:
         """
         Fetch news from Yahoo Finance RSS feed
         
@@ -84,8 +140,7 @@ class NewsCollector:
         articles = []
         
         try:
-            url = "https://finance.yahoo.com/news/rssindex"
-            feed = feedparser.parse(url)
+            feed = self._fetch_feed(_YAHOO_FINANCE_RSS_URL)
             
             for entry in feed.entries[:max_results]:
                 try:
@@ -98,88 +153,45 @@ class NewsCollector:
                     if pub_date and pub_date < self.cutoff_date:
                         continue
                     
-                    article = {
-                        'title': entry.get('title', ''),
-                        'description': entry.get('summary', ''),
-                        'url': entry.get('link', ''),
-                        'published_at': pub_date,
-                        'source': 'Yahoo Finance',
-                        'query': 'general_market'
-                    }
+                    article = Article(
+                        title=entry.get('title', ''),
+                        description=entry.get('summary', ''),
+                        url=entry.get('link', ''),
+                        published_at=pub_date,
+                        source='Yahoo Finance',
+                        query='general_market'
+                    )
                     articles.append(article)
                     
                 except Exception as e:
                     continue
             
-            time.sleep(0.5)
-            
         except Exception as e:
             console.print(f"[yellow]Warning:[/yellow] Could not fetch Yahoo Finance RSS: {str(e)}")
         
         return articles
     
-    def collect_market_news(self) -> Dict[str, List[Dict]]:
+    def collect_market_news(self) -> Dict[str, List[Article]]:
         """
         Collect news for all relevant topics
         
         Returns:
             Dictionary of news by category
         """
-        news_by_category = {
-            'sp500': [],
-            'cw8': [],
-            'stoxx600': [],  # NEW: STOXX 600 European news
-            'market_general': [],
-            'recession': [],
-            'ai_bubble': [],
-            'fed_policy': [],
-            'ecb_policy': [],
-            'dollar_eur': [],
-            'm2_liquidity': []
-        }
-        
         console.print("\n[bold]📰 Collecting News[/bold]")
         console.print("─" * 60)
         
-        # S&P 500 news - INCREASED from 15 to 30
-        console.print("• Fetching S&P 500 news...")
-        news_by_category['sp500'] = self.fetch_google_news("S&P 500 stock market", max_results=30)
-        
-        # MSCI World / Global markets - INCREASED from 10 to 25
-        console.print("• Fetching MSCI World news...")
-        news_by_category['cw8'] = self.fetch_google_news("MSCI World index global stocks", max_results=25)
-        
-        # NEW: STOXX 600 European news
-        console.print("• Fetching STOXX 600 European news...")
-        news_by_category['stoxx600'] = self.fetch_google_news("STOXX 600 European stocks Europe equity market", max_results=25)
-        
-        # General market news - INCREASED from 15 to 30
-        console.print("• Fetching general market news...")
-        news_by_category['market_general'] = self.fetch_yahoo_finance_rss(max_results=30)
-        
-        # Recession indicators - INCREASED from 10 to 20
-        console.print("• Fetching recession news...")
-        news_by_category['recession'] = self.fetch_google_news("recession economy unemployment GDP", max_results=20)
-        
-        # AI bubble - INCREASED from 10 to 20
-        console.print("• Fetching AI sector news...")
-        news_by_category['ai_bubble'] = self.fetch_google_news("AI artificial intelligence bubble tech stocks valuation", max_results=20)
-        
-        # Fed policy - INCREASED from 10 to 20
-        console.print("• Fetching Federal Reserve news...")
-        news_by_category['fed_policy'] = self.fetch_google_news("Federal Reserve Fed interest rates policy", max_results=20)
-        
-        # ECB policy - INCREASED from 8 to 15
-        console.print("• Fetching ECB news...")
-        news_by_category['ecb_policy'] = self.fetch_google_news("European Central Bank ECB euro policy", max_results=15)
-        
-        # Dollar / EUR/USD - INCREASED from 10 to 20
-        console.print("• Fetching currency news...")
-        news_by_category['dollar_eur'] = self.fetch_google_news("dollar euro EUR/USD exchange rate currency", max_results=20)
-        
-        # M2 Money Supply / Liquidity - INCREASED from 8 to 20
-        console.print("• Fetching liquidity news...")
-        news_by_category['m2_liquidity'] = self.fetch_google_news("money supply liquidity M2 monetary policy", max_results=20)
+        # Feeds are independent network round-trips: fetch them concurrently
+        with ThreadPoolExecutor(max_workers=_NEWS_FETCH_WORKERS) as executor:
+            futures = {}
+            for category, label, query, max_results in _NEWS_FEEDS:
+                console.print(f"• Fetching {label}...")
+                if query is None:
+                    futures[category] = executor.submit(self.fetch_yahoo_finance_rss, max_results=max_results)
+                else:
+                    futures[category] = executor.submit(self.fetch_google_news, query, max_results=max_results)
+            
+            news_by_category = {category: future.result() for category, future in futures.items()}
         
         # Count total articles
         total = sum(len(articles) for articles in news_by_category.values())
@@ -187,7 +199,7 @@ class NewsCollector:
         
         return news_by_category
     
-    def deduplicate_articles(self, articles: List[Dict]) -> List[Dict]:
+    def deduplicate_articles(self, articles: List[Article]) -> List[Article]:
         """
         Remove duplicate articles based on title similarity
         
@@ -202,7 +214,7 @@ class NewsCollector:
         
         for article in articles:
             # Simple deduplication by title
-            title_key = article['title'].lower().strip()[:50]  # First 50 chars
+            title_key = article.title.lower().strip()[:50]  # First 50 chars
             
             if title_key not in seen_titles:
                 seen_titles.add(title_key)
@@ -210,7 +222,7 @@ class NewsCollector:
         
         return unique_articles
     
-    def get_all_articles(self, news_by_category: Dict[str, List[Dict]]) -> List[Dict]:
+    def get_all_articles(self, news_by_category: Dict[str, List[Article]]) -> List[Article]:
         """
         Get all articles combined and deduplicated
         
@@ -221,7 +233,7 @@ class NewsCollector:
         
         for category, articles in news_by_category.items():
             for article in articles:
-                article['category'] = category
+                article.category = category
                 all_articles.append(article)
         
         # Deduplicate
@@ -229,7 +241,7 @@ class NewsCollector:
         
         # Sort by date (newest first)
         unique_articles.sort(
-            key=lambda x: x['published_at'] if x['published_at'] else datetime.min,
+            key=lambda x: x.published_at if x.published_at else datetime.min,
             reverse=True
         )
         
@@ -1,13 +1,64 @@
 """Report generation and export functionality"""
 
-import json
+import hashlib
 import csv
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
+import orjson
 from rich.table import Table
 from rich.panel import Panel
 from rich.console import Console
+from rich.text import Text
+from src.decision_engine import RecommendationResult
+
+
+class PlainTable:
+    """
+    Minimal stand-in for the rich Table API used by ReportGenerator
+    
+    Cells are padded/truncated to their fixed column widths and rendered as a
+    single Text, skipping rich's table layout (measuring, wrapping, borders).
+    """
+    
+    def __init__(self, title: str = "", header_style: str = "bold", **kwargs):
+        self.title = title
+        self.header_style = header_style
+        self.columns: List[tuple] = []
+        self.rows: List[Optional[tuple]] = []
+    
+    def add_column(self, header: str, style: str = "", width: int = 20, **kwargs):
+        self.columns.append((header, style, width))
+    
+    def add_row(self, *cells: str):
+        self.rows.append(cells)
+    
+    def add_section(self):
+        self.rows.append(None)  # Rendered as a separator line
+    
+    def _render_line(self, cells, style: Optional[str] = None) -> Text:
+        line = Text()
+        for cell, (_, column_style, width) in zip(cells, self.columns):
+            text = Text.from_markup(cell, style=style or column_style)
+            text.truncate(width, overflow='ellipsis', pad=True)
+            line.append_text(text)
+            line.append(" ")
+        return line
+    
+    def __rich__(self) -> Text:
+        separator = "─" * sum(width + 1 for _, _, width in self.columns)
+        
+        output = Text(self.title + "\n", style="bold", no_wrap=True, overflow="ignore")
+        output.append_text(self._render_line([header for header, _, _ in self.columns], self.header_style))
+        output.append("\n" + separator + "\n")
+        for row in self.rows:
+            if row is None:
+                output.append(separator + "\n")
+            else:
+                output.append_text(self._render_line(row))
+                output.append("\n")
+        output.rstrip()
+        return output
 
 
 class ReportGenerator:
@@ -16,10 +67,17 @@ class ReportGenerator:
     Supports: Console output, TXT, JSON, CSV
     """
     
-    def __init__(self, reports_dir: str = "./reports"):
+    def __init__(self, reports_dir: str = "./reports", simple: bool = False):
         self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.console = Console()
+        self.simple = simple  # Render tables as PlainTable text instead of rich Tables
+    
+    def _new_table(self, title: str, header_style: str):
+        """Create a rich Table, or a PlainTable in simple mode"""
+        if self.simple:
+            return PlainTable(title=title, header_style=header_style)
+        return Table(title=title, show_header=True, header_style=header_style)
     
     def create_summary_table(
         self,
@@ -30,7 +88,7 @@ class ReportGenerator:
         stoxx600_data: Optional[Dict] = None
     ) -> Table:
         """Create a summary table of all key metrics"""
-        table = Table(title="📊 Market Summary", show_header=True, header_style="bold cyan")
+        table = self._new_table("📊 Market Summary", "bold cyan")
         
         table.add_column("Metric", style="cyan", width=25)
         table.add_column("S&P 500", style="white", width=20)
@@ -218,13 +276,13 @@ class ReportGenerator:
     
     def create_recommendation_table(
         self,
-        sp500_rec: Dict,
-        cw8_rec: Dict,
+        sp500_rec: RecommendationResult,
+        cw8_rec: RecommendationResult,
         comparison: Dict,
-        stoxx600_rec: Optional[Dict] = None
+        stoxx600_rec: Optional[RecommendationResult] = None
     ) -> Table:
         """Create a table showing recommendations"""
-        table = Table(title="🎯 Investment Recommendations", show_header=True, header_style="bold cyan")
+        table = self._new_table("🎯 Investment Recommendations", "bold cyan")
         
         table.add_column("Index", style="cyan", width=15)
         table.add_column("Recommendation", width=15)
@@ -236,45 +294,45 @@ class ReportGenerator:
         best_index = comparison.get('best_index', 'sp500').lower()
         
         # SP500
-        sp500_emoji = self._get_recommendation_emoji(sp500_rec['recommendation'].value)
-        sp500_color = self._get_recommendation_color(sp500_rec['recommendation'].value)
-        sp500_factors = " • ".join(sp500_rec['reasons'][:2]) if sp500_rec['reasons'] else "See details"
+        sp500_emoji = self._get_recommendation_emoji(sp500_rec.recommendation.name)
+        sp500_color = self._get_recommendation_color(sp500_rec.recommendation.name)
+        sp500_factors = " • ".join(sp500_rec.reasons[:2]) if sp500_rec.reasons else "See details"
         sp500_label = "📈 S&P 500" + (" ⭐" if best_index == 'sp500' else "")
         
         table.add_row(
             sp500_label,
-            f"[{sp500_color}]{sp500_emoji} {sp500_rec['recommendation'].value}[/{sp500_color}]",
-            f"{sp500_rec['confidence']:.0%}",
-            f"{sp500_rec['score']:+d}",
+            f"[{sp500_color}]{sp500_emoji} {sp500_rec.recommendation.name}[/{sp500_color}]",
+            f"{sp500_rec.confidence:.0%}",
+            f"{sp500_rec.score:+d}",
             sp500_factors[:40] + "..." if len(sp500_factors) > 40 else sp500_factors
         )
         
         # CW8
-        cw8_emoji = self._get_recommendation_emoji(cw8_rec['recommendation'].value)
-        cw8_color = self._get_recommendation_color(cw8_rec['recommendation'].value)
-        cw8_factors = " • ".join(cw8_rec['reasons'][:2]) if cw8_rec['reasons'] else "See details"
+        cw8_emoji = self._get_recommendation_emoji(cw8_rec.recommendation.name)
+        cw8_color = self._get_recommendation_color(cw8_rec.recommendation.name)
+        cw8_factors = " • ".join(cw8_rec.reasons[:2]) if cw8_rec.reasons else "See details"
         cw8_label = "🌍 MSCI World" + (" ⭐" if best_index == 'cw8' else "")
         
         table.add_row(
             cw8_label,
-            f"[{cw8_color}]{cw8_emoji} {cw8_rec['recommendation'].value}[/{cw8_color}]",
-            f"{cw8_rec['confidence']:.0%}",
-            f"{cw8_rec['score']:+d}",
+            f"[{cw8_color}]{cw8_emoji} {cw8_rec.recommendation.name}[/{cw8_color}]",
+            f"{cw8_rec.confidence:.0%}",
+            f"{cw8_rec.score:+d}",
             cw8_factors[:40] + "..." if len(cw8_factors) > 40 else cw8_factors
         )
         
         # STOXX600 (if available)
         if stoxx600_rec:
-            stoxx_emoji = self._get_recommendation_emoji(stoxx600_rec['recommendation'].value)
-            stoxx_color = self._get_recommendation_color(stoxx600_rec['recommendation'].value)
-            stoxx_factors = " • ".join(stoxx600_rec['reasons'][:2]) if stoxx600_rec['reasons'] else "See details"
+            stoxx_emoji = self._get_recommendation_emoji(stoxx600_rec.recommendation.name)
+            stoxx_color = self._get_recommendation_color(stoxx600_rec.recommendation.name)
+            stoxx_factors = " • ".join(stoxx600_rec.reasons[:2]) if stoxx600_rec.reasons else "See details"
             stoxx_label = "🇪🇺 STOXX 600" + (" ⭐" if best_index == 'stoxx600' else "")
             
             table.add_row(
                 stoxx_label,
-                f"[{stoxx_color}]{stoxx_emoji} {stoxx600_rec['recommendation'].value}[/{stoxx_color}]",
-                f"{stoxx600_rec['confidence']:.0%}",
-                f"{stoxx600_rec['score']:+d}",
+                f"[{stoxx_color}]{stoxx_emoji} {stoxx600_rec.recommendation.name}[/{stoxx_color}]",
+                f"{stoxx600_rec.confidence:.0%}",
+                f"{stoxx600_rec.score:+d}",
                 stoxx_factors[:40] + "..." if len(stoxx_factors) > 40 else stoxx_factors
             )
         
@@ -305,7 +363,7 @@ class ReportGenerator:
         bearish_ratio: float
     ) -> Table:
         """Create a risk assessment summary table"""
-        table = Table(title="⚠️ Risk Assessment", show_header=True, header_style="bold yellow")
+        table = self._new_table("⚠️ Risk Assessment", "bold yellow")
         
         table.add_column("Risk Factor", style="yellow", width=25)
         table.add_column("Level", width=15)
@@ -477,12 +535,7 @@ class ReportGenerator:
             filename = f"investment_report_{timestamp}.json"
         
         filepath = self.reports_dir / filename
-        
-        # Convert Enum values to strings
-        json_data = self._prepare_for_json(report_data)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, default=str)
+        filepath.write_bytes(self._dump_json(report_data, indent=True))
         
         return filepath
     
@@ -568,16 +621,35 @@ class ReportGenerator:
         
         return filepath
     
-    def _prepare_for_json(self, data: Dict) -> Dict:
-        """Prepare data for JSON serialization (convert Enums, etc.)"""
-        import copy
-        json_data = copy.deepcopy(data)
-        
-        # Convert recommendation Enums to strings
-        for idx_key in ['sp500', 'cw8']:
-            if 'recommendations' in json_data and idx_key in json_data['recommendations']:
-                rec = json_data['recommendations'][idx_key].get('recommendation')
-                if hasattr(rec, 'value'):
-                    json_data['recommendations'][idx_key]['recommendation'] = rec.value
-        
-        return json_data
+    def get_cache_path(self, inputs: Dict) -> Path:
+        """Path of the cached report for a fingerprint of the analysis inputs"""
+        payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS, default=str)
+        fingerprint = hashlib.sha1(payload).hexdigest()[:12]
+        return self.reports_dir / f"cache_{fingerprint}.json"
+    
+    def load_cached_report(self, cache_path: Path) -> Optional[Dict]:
+        """Load a previously cached report, or None if missing/unreadable"""
+        if not cache_path.exists():
+            return None
+        
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def save_cached_report(self, cache_path: Path, report_data: Dict) -> Path:
+        """Cache report data for reuse, dropping caches for older inputs"""
+        for stale in self.reports_dir.glob("cache_*.json"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        
+        cache_path.write_bytes(self._dump_json(report_data))
+        
+        return cache_path
+    
+    def _dump_json(self, data: Dict, indent: bool = False) -> bytes:
+        """Serialize report data (Enums, numpy scalars and non-str keys handled by orjson)"""
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=str)
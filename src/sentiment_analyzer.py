@@ -6,6 +6,8 @@ import pandas as pd
 from datetime import datetime
 import numpy as np
 
+from src.news_collector import Article
+
 
 class SentimentAnalyzer:
     """Analyze sentiment of news articles and text"""
@@ -76,30 +78,30 @@ class SentimentAnalyzer:
             'label': label
         }
     
-    def analyze_article(self, article: Dict) -> Dict:
+    def analyze_article(self, article: Article) -> Article:
         """
         Analyze sentiment of a news article
         
         Args:
-            article: Article dictionary with title and description
+            article: Article with title and description
             
         Returns:
             Article with sentiment added
         """
         # Combine title and description for analysis
-        text = f"{article.get('title', '')} {article.get('description', '')}"
+        text = f"{article.title} {article.description}"
         
         sentiment = self.analyze_text(text)
         
         # Add sentiment to article
-        article['sentiment_score'] = sentiment['compound']
-        article['sentiment_label'] = sentiment['label']
-        article['sentiment_positive'] = sentiment['positive']
-        article['sentiment_negative'] = sentiment['negative']
+        article.sentiment_score = sentiment['compound']
+        article.sentiment_label = sentiment['label']
+        article.sentiment_positive = sentiment['positive']
+        article.sentiment_negative = sentiment['negative']
         
         return article
     
-    def analyze_articles(self, articles: List[Dict]) -> List[Dict]:
+    def analyze_articles(self, articles: List[Article]) -> List[Article]:
         """
         Analyze sentiment for multiple articles
         
@@ -108,7 +110,7 @@ class SentimentAnalyzer:
         """
         return [self.analyze_article(article) for article in articles]
     
-    def aggregate_sentiment(self, articles: List[Dict], 
+    def aggregate_sentiment(self, articles: List[Article], 
                           decay_factor: float = 0.9) -> Dict:
         """
         Calculate weighted aggregate sentiment (recent news weighted more)
@@ -133,7 +135,7 @@ class SentimentAnalyzer:
         # Sort by date
         sorted_articles = sorted(
             articles,
-            key=lambda x: x.get('published_at') or datetime.min,
+            key=lambda x: x.published_at or datetime.min,
             reverse=False  # Oldest first for decay calculation
         )
         
@@ -146,8 +148,8 @@ class SentimentAnalyzer:
         now = datetime.now()
         
         for article in sorted_articles:
-            sentiment_score = article.get('sentiment_score', 0)
-            sentiment_label = article.get('sentiment_label', 'neutral')
+            sentiment_score = article.sentiment_score
+            sentiment_label = article.sentiment_label
             
             # Count by label
             if sentiment_label == 'positive':
@@ -158,7 +160,7 @@ class SentimentAnalyzer:
                 neutral_count += 1
             
             # Calculate weight based on age
-            pub_date = article.get('published_at')
+            pub_date = article.published_at
             if pub_date:
                 age_days = (now - pub_date).days
                 weight = decay_factor ** age_days
@@ -193,7 +195,7 @@ class SentimentAnalyzer:
             'negative_ratio': negative_count / len(articles) if articles else 0
         }
     
-    def calculate_recession_probability(self, articles: List[Dict]) -> Dict:
+    def calculate_recession_probability(self, articles: List[Article]) -> Dict:
         """
         Estimate recession probability based on news sentiment and keywords
         
@@ -215,13 +217,13 @@ class SentimentAnalyzer:
         recession_sentiment_sum = 0
         
         for article in articles:
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
+            text = f"{article.title} {article.description}".lower()
             
             # Check for recession keywords
             for keyword in self.recession_keywords:
                 if keyword in text:
                     recession_mentions += 1
-                    recession_sentiment_sum += article.get('sentiment_score', 0)
+                    recession_sentiment_sum += article.sentiment_score
                     break  # Count article only once
         
         # Calculate probability based on mentions and sentiment
@@ -256,7 +258,7 @@ class SentimentAnalyzer:
             'sentiment': recession_sentiment_sum / recession_mentions if recession_mentions > 0 else 0
         }
     
-    def calculate_ai_bubble_risk(self, articles: List[Dict]) -> Dict:
+    def calculate_ai_bubble_risk(self, articles: List[Article]) -> Dict:
         """
         Estimate AI/tech bubble risk based on news
         
@@ -278,13 +280,13 @@ class SentimentAnalyzer:
         bubble_sentiment_sum = 0
         
         for article in articles:
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
+            text = f"{article.title} {article.description}".lower()
             
             # Check for AI bubble keywords
             for keyword in self.ai_bubble_keywords:
                 if keyword in text and ('ai' in text or 'tech' in text or 'technology' in text):
                     bubble_mentions += 1
-                    bubble_sentiment_sum += article.get('sentiment_score', 0)
+                    bubble_sentiment_sum += article.sentiment_score
                     break
         
         # Calculate risk
@@ -317,7 +319,7 @@ class SentimentAnalyzer:
             'sentiment': bubble_sentiment_sum / bubble_mentions if bubble_mentions > 0 else 0
         }
     
-    def analyze_market_sentiment(self, articles: List[Dict]) -> Dict:
+    def analyze_market_sentiment(self, articles: List[Article]) -> Dict:
         """
         Comprehensive market sentiment analysis
         
@@ -331,7 +333,7 @@ class SentimentAnalyzer:
         bearish_count = 0
         
         for article in articles:
-            text = f"{article.get('title', '')} {article.get('description', '')}".lower()
+            text = f"{article.title} {article.description}".lower()
             
             # Check for bullish keywords
             for keyword in self.bullish_keywords:
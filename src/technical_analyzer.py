@@ -1,25 +1,45 @@
 """Technical analysis module for calculating market indicators"""
 
+import threading
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-from ta.trend import MACD, SMAIndicator, EMAIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator
+from ta.trend import MACD
+from ta.momentum import StochasticOscillator
 from ta.volatility import BollingerBands, AverageTrueRange
 from typing import Dict, Optional, Tuple
 from src.config import TECHNICAL_PARAMS
 
+# Comprehensive analysis results keyed by (index_name, last_bar_date, n_rows),
+# least recently used first; analyses run on worker threads, hence the lock
+_ANALYSIS_CACHE: 'OrderedDict[Tuple[str, str, int], Dict]' = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 16
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+
+def invalidate_analysis_cache(index_name: str):
+    """Drop cached analyses for an index (call after new bars are stored)"""
+    with _ANALYSIS_CACHE_LOCK:
+        for key in [k for k in _ANALYSIS_CACHE if k[0] == index_name]:
+            del _ANALYSIS_CACHE[key]
+
+
+def _copy_analysis(result: Dict) -> Dict:
+    """Copy of a cached analysis whose dataframe can be modified by the caller"""
+    return {**result, 'dataframe': result['dataframe'].copy()}
+
 
 class TechnicalAnalyzer:
     """Calculate technical indicators for market data"""
     
     def __init__(self):
-        self.rsi_period = TECHNICAL_PARAMS['rsi_period']
-        self.ma_short = TECHNICAL_PARAMS['ma_short']
-        self.ma_long = TECHNICAL_PARAMS['ma_long']
-        self.macd_fast = TECHNICAL_PARAMS['macd_fast']
-        self.macd_slow = TECHNICAL_PARAMS['macd_slow']
-        self.macd_signal = TECHNICAL_PARAMS['macd_signal']
-        self.lookback_window = TECHNICAL_PARAMS['lookback_window']
+        self.rsi_period = TECHNICAL_PARAMS.rsi_period
+        self.ma_short = TECHNICAL_PARAMS.ma_short
+        self.ma_long = TECHNICAL_PARAMS.ma_long
+        self.macd_fast = TECHNICAL_PARAMS.macd_fast
+        self.macd_slow = TECHNICAL_PARAMS.macd_slow
+        self.macd_signal = TECHNICAL_PARAMS.macd_signal
+        self.lookback_window = TECHNICAL_PARAMS.lookback_window
     
     def calculate_all_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -56,26 +76,30 @@ class TechnicalAnalyzer:
     
     def _calculate_moving_averages(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate Simple and Exponential Moving Averages"""
-        # Short-term MA (50-day)
-        sma_short = SMAIndicator(close=df['close'], window=self.ma_short)
-        df['sma_50'] = sma_short.sma_indicator()
-        
-        ema_short = EMAIndicator(close=df['close'], window=self.ma_short)
-        df['ema_50'] = ema_short.ema_indicator()
-        
-        # Long-term MA (200-day)
-        sma_long = SMAIndicator(close=df['close'], window=self.ma_long)
-        df['sma_200'] = sma_long.sma_indicator()
-        
-        ema_long = EMAIndicator(close=df['close'], window=self.ma_long)
-        df['ema_200'] = ema_long.ema_indicator()
+        # Windows computed straight on the close series (same definition as ta's
+        # SMAIndicator/EMAIndicator, without building an indicator object each)
+        close = df['close']
+        for suffix, window in (('50', self.ma_short), ('200', self.ma_long)):
+            df[f'sma_{suffix}'] = close.rolling(window, min_periods=window).mean()
+            df[f'ema_{suffix}'] = close.ewm(span=window, min_periods=window, adjust=False).mean()
         
         return df
     
     def _calculate_rsi(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate Relative Strength Index"""
-        rsi = RSIIndicator(close=df['close'], window=self.rsi_period)
-        df['rsi'] = rsi.rsi()
+        # Wilder smoothing of gains/losses (same definition as ta's RSIIndicator),
+        # with both averages computed in a single ewm pass
+        delta = np.diff(df['close'].to_numpy(dtype=np.float64), prepend=np.nan)
+        moves = pd.DataFrame({
+            'up': np.where(delta > 0, delta, 0.0),
+            'down': np.where(delta < 0, -delta, 0.0)
+        })
+        smoothed = moves.ewm(alpha=1 / self.rsi_period, min_periods=self.rsi_period, adjust=False).mean()
+        avg_up = smoothed['up'].to_numpy()
+        avg_down = smoothed['down'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_down == 0, 100, 100 - (100 / (1 + avg_up / avg_down)))
+        df['rsi'] = rsi
         return df
     
     def _calculate_macd(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -314,16 +338,31 @@ class TechnicalAnalyzer:
             'distance_to_support': ((current_price - support) / current_price) * 100
         }
     
-    def calculate_comprehensive_analysis(self, df: pd.DataFrame) -> Dict:
+    def calculate_comprehensive_analysis(self, df: pd.DataFrame,
+                                         index_name: Optional[str] = None) -> Dict:
         """
         Perform comprehensive technical analysis
         
         Args:
             df: DataFrame with OHLCV data
+            index_name: Optional index label; when given, results are cached
+                        by (index_name, last bar date, row count)
             
         Returns:
-            Dictionary with all technical analysis results
+            Dictionary with all technical analysis results (cached results are
+            returned as a copy with their own dataframe; the nested analysis
+            dicts are shared and should be treated as read-only)
         """
+        cache_key = None
+        if index_name is not None and df is not None and len(df) > 0:
+            cache_key = (index_name, str(pd.Timestamp(df.index[-1]).date()), len(df))
+            with _ANALYSIS_CACHE_LOCK:
+                cached = _ANALYSIS_CACHE.get(cache_key)
+                if cached is not None:
+                    _ANALYSIS_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                return _copy_analysis(cached)
+        
         # Calculate all indicators first
         df = self.calculate_all_indicators(df)
         
@@ -334,7 +373,7 @@ class TechnicalAnalyzer:
         volatility_analysis = self.analyze_volatility(df)
         support_resistance = self.get_support_resistance(df)
         
-        return {
+        result = {
             'dip': dip_analysis,
             'trend': trend_analysis,
             'momentum': momentum_analysis,
@@ -342,6 +381,16 @@ class TechnicalAnalyzer:
             'support_resistance': support_resistance,
             'dataframe': df  # Return updated dataframe with indicators
         }
+        
+        if cache_key is not None:
+            with _ANALYSIS_CACHE_LOCK:
+                _ANALYSIS_CACHE[cache_key] = result
+                _ANALYSIS_CACHE.move_to_end(cache_key)
+                while len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                    _ANALYSIS_CACHE.popitem(last=False)
+            return _copy_analysis(result)
+        
+        return result
 
 
 def calculate_currency_adjusted_returns(